@@ -193,7 +193,9 @@ def norm_xcorr(sig1, sig2, out="both"):
     return xcc
 
 
-def norm_twod_xcorr(sig1=None, sig2=None, mode="full", df1=None, df2=None):
+def norm_twod_xcorr(
+    sig1=None, sig2=None, mode="full", method="direct", df1=None, df2=None,
+):
     """
     Normalised 2-dimensional cross-correlation of 2, 2D signals.
 
@@ -222,6 +224,22 @@ def norm_twod_xcorr(sig1=None, sig2=None, mode="full", df1=None, df2=None):
         ``same``
            The output is the same size as `in1`, centered
            with respect to the 'full' output.
+    method : str {"direct", "fft", "auto"}, default "direct"
+        A string indicating how to compute the correlation (ignored if
+        mode="same", which always uses the direct method):
+
+        ``direct``
+           The correlation is determined directly from sums. (Default)
+
+        ``fft``
+           The Fast Fourier Transform is used to perform the correlation.
+           This is considerably faster on long signals but its tiny floating
+           point errors can slightly alter the correlation values and the
+           position of the peak among nearly identical values.
+
+        ``auto``
+           Automatically chooses direct or Fourier method based on an
+           estimate of which is faster.
     df1 : None
         This parameter is deprecated and will be removed in future releases.
         Use "sig1" instead.
@@ -311,8 +329,18 @@ def norm_twod_xcorr(sig1=None, sig2=None, mode="full", df1=None, df2=None):
     arr1 = sig1.to_numpy() if is_dataframe else sig1
     arr2 = sig2.to_numpy() if is_dataframe else sig2
 
-    # Perform 2D cross-correlation
-    corr = signal.correlate2d(in1=arr1, in2=arr2, mode=mode)
+    # Perform 2D cross-correlation. correlate2d runs the direct O(N^2)
+    # algorithm and is by far the fastest option for the STA-sized inputs
+    # this function is typically called with, so the direct method always
+    # goes through it. signal.correlate provides the FFT-based
+    # (O(N log N)) methods for long signals. mode="same" also always uses
+    # correlate2d because signal.correlate centers the "same" output
+    # differently for even-sized inputs and the historical lag convention
+    # is relied upon by align_by_xcorr.
+    if mode == "same" or method == "direct":
+        corr = signal.correlate2d(in1=arr1, in2=arr2, mode=mode)
+    else:
+        corr = signal.correlate(in1=arr1, in2=arr2, mode=mode, method=method)
 
     # Compute normalization factor
     norm_factor = np.sqrt((arr1**2).sum() * (arr2**2).sum())
@@ -336,7 +364,7 @@ def norm_twod_xcorr(sig1=None, sig2=None, mode="full", df1=None, df2=None):
     return normxcorr, normxcorr_max
 
 
-def compute_sil(ipts, mupulses, ignore_negative_ipts=False):
+def compute_sil(ipts, mupulses, ignore_negative_ipts=False, subsample=None):
     """
     Calculate the Silhouette score for a single MU.
 
@@ -346,14 +374,20 @@ def compute_sil(ipts, mupulses, ignore_negative_ipts=False):
 
     Parameters
     ----------
-    ipts : pd.Series
+    ipts : pd.Series or ndarray
         The  decomposed source (or pulse train, IPTS[mu]) of the MU of
-        interest.
+        interest. If an ndarray is passed, mupulses are assumed to refer to
+        positions in the array (i.e., the first sample is sample 0).
     mupulses : ndarray
         The time of firing (MUPULSES[mu]) of the MU of interest.
     ignore_negative_ipts : bool, default False
         If True, only use positive ipts during peak and noise clustering. This
         is particularly important for sources with large negative components.
+    subsample : int or None, default None
+        If set, peak and noise clusters larger than subsample are randomly
+        subsampled (with a fixed seed, for reproducibility) before computing
+        the point-to-centroid distances. This bounds the computation time on
+        long recordings with negligible impact on the score.
 
     Returns
     -------
@@ -384,19 +418,37 @@ def compute_sil(ipts, mupulses, ignore_negative_ipts=False):
         return np.nan
 
     # Extract source and peaks and align source and peaks based on IPTS
-    source = ipts.to_numpy()
+    if isinstance(ipts, np.ndarray):
+        source = ipts
+        first_idx = 0
+    else:
+        source = ipts.to_numpy()
+        first_idx = ipts.index[0]
 
     if ignore_negative_ipts:
         # Ignore negative values, this is particularly needed for negative
         # unbalanced sources.
         source = source * np.abs(source)
 
-    peaks_idxs = mupulses - ipts.index[0]
+    peaks_idxs = mupulses - first_idx
 
     # Create clusters
     peak_cluster = source[peaks_idxs]
     noise_cluster = np.delete(source, peaks_idxs)
 
+    # Subsample the clusters to bound the computation time on long
+    # recordings.
+    if subsample is not None:
+        rng = np.random.default_rng(0)
+        if len(peak_cluster) > subsample:
+            peak_cluster = rng.choice(
+                peak_cluster, size=subsample, replace=False,
+            )
+        if len(noise_cluster) > subsample:
+            noise_cluster = rng.choice(
+                noise_cluster, size=subsample, replace=False,
+            )
+
     # Create centroids for each cluster
     peak_centroid = np.mean(peak_cluster)
     noise_centroid = np.mean(noise_cluster)
@@ -934,12 +986,22 @@ def find_mle_teta(sig1, sig2, ied, fsamp):
         raise ValueError("sig2 is not 1 dimesional")
 
     delay = np.arange(teta_min, teta_max+1)
-    corrpos = np.zeros(len(delay))
-    for idx, i in enumerate(delay):
-        sig1_tosum = sig1[:len(sig1)-i]
-        sig2_tosum = sig2[i:]
 
-        corrpos[idx-teta_min+1] = np.sum(sig1_tosum * sig2_tosum)
+    # The sliding dot products for all the delays are the positive lags of
+    # the cross-correlation, computed in a single C-level call instead of
+    # one Python iteration per delay. Delays exceeding the signal length
+    # have an empty overlap and stay 0.
+    n = len(sig1)
+    vals = np.zeros(len(delay))
+    upper = min(teta_max, n - 1)
+    if upper >= teta_min:
+        vals[: upper - teta_min + 1] = np.correlate(
+            sig2, sig1, mode="full",
+        )[n - 1 + teta_min: n + upper]
+
+    # Keep the historical layout of corrpos, where the value for delay[idx]
+    # is stored at position idx - teta_min + 1 (wrapping around).
+    corrpos = np.roll(vals, 1 - teta_min)
 
     pos = corrpos.argmax() + 1
     # +1 is necessary to overcome base 0 and prevent teta from beeing 0
@@ -7,7 +7,7 @@ import pandas as pd
 import sys
 from openhdemg.library.tools import delete_mus
 from openhdemg.library.mathtools import (
-    norm_twod_xcorr, norm_xcorr, find_mle_teta, mle_cv_est,
+    norm_twod_xcorr, find_mle_teta, mle_cv_est,
 )
 from openhdemg.library.electrodes import sort_rawemg
 from openhdemg.library.plotemg import (
@@ -15,15 +15,11 @@ from openhdemg.library.plotemg import (
 )
 from scipy import signal
 import matplotlib.pyplot as plt
-from functools import reduce
 import numpy as np
 import time
 from joblib import Parallel, delayed
 import copy
 import os
-import tkinter as tk
-from tkinter import ttk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import warnings
 
 
@@ -100,19 +96,18 @@ def diff(sorted_rawemg):
 
     # Create a dict of pd.DataFrames for the single differential
     # {"col0": {}, "col1": {}, "col2": {}, "col3": {}, "col4": {}}
-    sd = {col: {} for col in sorted_rawemg.keys()}
+    sd = {}
 
-    # Loop matrix columns
+    # Loop matrix columns and subtract consecutive matrix rows in a single
+    # vectorised operation. float32 halves the memory traffic and is ample
+    # for EMG signals.
     for col in sorted_rawemg.keys():
-        # Loop matrix rows
-        for pos, row in enumerate(sorted_rawemg[col].columns):
-            if pos > 0:
-                res = (
-                    sorted_rawemg[col].loc[:, row - 1] - sorted_rawemg[col].loc[:, row]
-                )
-                sd[col][row] = res
-
-        sd[col] = pd.DataFrame(sd[col])
+        arr = sorted_rawemg[col].to_numpy(dtype=np.float32)
+        sd[col] = pd.DataFrame(
+            arr[:, :-1] - arr[:, 1:],
+            columns=sorted_rawemg[col].columns[1:],
+            index=sorted_rawemg[col].index,
+        )
 
     return sd
 
@@ -190,21 +185,22 @@ def double_diff(sorted_rawemg):
 
     # Create a dict of pd.DataFrames for the double differential
     # {"col0": {}, "col1": {}, "col2": {}, "col3": {}, "col4": {}}
-    dd = {col: {} for col in sorted_rawemg.keys()}
+    dd = {}
 
-    # Loop matrix columns
+    # Loop matrix columns and compute the second order difference of
+    # consecutive matrix rows in a single vectorised operation. float32
+    # halves the memory traffic and is ample for EMG signals.
     for col in sorted_rawemg.keys():
-        # Loop matrix rows
-        for pos, row in enumerate(sorted_rawemg[col].columns):
-            if pos > 1:
-                res = (
-                    -sorted_rawemg[col].loc[:, row - 2]
-                    + 2 * sorted_rawemg[col].loc[:, row - 1]
-                    - sorted_rawemg[col].loc[:, row]
-                )
-                dd[col][row] = res
-
-        dd[col] = pd.DataFrame(dd[col])
+        arr = sorted_rawemg[col].to_numpy(dtype=np.float32)
+        # Accumulate the stencil in place to allocate a single temporary.
+        out = 2 * arr[:, 1:-1]
+        out -= arr[:, :-2]
+        out -= arr[:, 2:]
+        dd[col] = pd.DataFrame(
+            out,
+            columns=sorted_rawemg[col].columns[2:],
+            index=sorted_rawemg[col].index,
+        )
 
     return dd
 
@@ -263,7 +259,8 @@ def extract_delsys_muaps(emgfile):
 
 
 def sta(
-    emgfile, sorted_rawemg, firings=[0, 50], timewindow=50
+    emgfile, sorted_rawemg, firings=[0, 50], timewindow=50,
+    multiprocessing=True,
 ):
     """
     Computes the spike-triggered average (STA) of every MUs.
@@ -285,6 +282,9 @@ def sta(
             The STA is calculated over all the firings.
     timewindow : int, default 50
         Timewindow to compute STA in milliseconds.
+    multiprocessing : bool, default True
+        If True (default) parallel processing will be used to reduce execution
+        time.
 
     Returns
     -------
@@ -372,12 +372,29 @@ def sta(
     halftime = round(timewindow_samples / 2)
     tottime = halftime * 2
 
-    # Container of the STA for every MUs
-    # {0: {}, 1: {}, 2: {}, 3: {}}
-    sta_dict = {mu: {} for mu in range(emgfile["NUMBER_OF_MUS"])}
+    # Convert each matrix column to a contiguous float32 2D array once for
+    # all the MUs. float32 halves the memory traffic and matches the
+    # precision of the stored RAW_SIGNAL.
+    np_cols = {
+        col: np.ascontiguousarray(
+            sorted_rawemg[col].to_numpy(dtype=np.float32)
+        )
+        for col in sorted_rawemg.keys()
+    }
+    emg_length = len(next(iter(sorted_rawemg.values())).index)
 
-    # Calculate STA on sorted_rawemg for every mu and put it into sta_dict[mu]
-    for mu in sta_dict.keys():
+    # The NaN-status of a channel is fixed for the whole call, scan it once
+    # per column instead of once per empty MU
+    nan_cols = {
+        col: np.all(np.isnan(np_cols[col]), axis=0)
+        for col in np_cols.keys()
+    }
+
+    # Offsets of a MUAP window relative to its pulse, shared by all the MUs
+    window_offsets = np.arange(-halftime, halftime)
+
+    # STA function to run in parallel (1 job per MU)
+    def parallel(mu):
         # Check if there are firings in this MU
         tot_firings = len(emgfile["MUPULSES"][mu])
         if tot_firings == 0:
@@ -392,35 +409,57 @@ def sta(
         # Get current mupulses
         thismups = emgfile["MUPULSES"][mu][firings_[0]: firings_[1]]
 
-        # Calculate STA for each column in sorted_rawemg
+        # Manage exception of no firings: set the STA to zeros (while
+        # preserving the empty channels) without entering the gather path.
+        if len(thismups) == 0:
+            sorted_rawemg_sta = {}
+            for col in sorted_rawemg.keys():
+                sta_mat = np.zeros(
+                    (tottime, np_cols[col].shape[1]), dtype=np.float32,
+                )
+                sta_mat[:, nan_cols[col]] = np.nan
+                sorted_rawemg_sta[col] = pd.DataFrame(
+                    sta_mat, columns=sorted_rawemg[col].columns,
+                )
+            return sorted_rawemg_sta
+
+        # Precompute the windows indices (F x tottime) for the complete MUAPs
+        # once per MU. Incomplete MUAPs at the edges of the signal are
+        # excluded.
+        pulses = np.asarray(thismups)
+        valid = (pulses >= halftime) & (pulses + halftime <= emg_length)
+        idx = pulses[valid][:, None] + window_offsets[None, :]
+
+        # Calculate STA for each column in sorted_rawemg. Gather all the
+        # MUAPs windows of the matrix column at once with a single
+        # fancy-indexing operation (F x tottime x channels) and average them.
         sorted_rawemg_sta = {}
         for col in sorted_rawemg.keys():
-            row_dict = {}
-            for row in sorted_rawemg[col].columns:
-                emg_array = sorted_rawemg[col][row].to_numpy()
-                # Calculate STA using NumPy vectorized operations
-                sta_values = []
-                if len(thismups) > 0:  # Manage exception of no firings
-                    for pulse in thismups:
-                        ls = emg_array[pulse - halftime: pulse + halftime]
-                        # Avoid incomplete muaps
-                        if len(ls) == tottime:
-                            sta_values.append(ls)
-                else:
-                    # If no firings, set STA to zeros (while preserving the
-                    # empty channel.
-                    if np.all(np.isnan(emg_array)):
-                        sta_values.append(np.full((tottime, ), np.nan))
-                    else:
-                        sta_values.append(np.full((tottime, ), 0))
-                row_dict[row] = np.mean(sta_values, axis=0)
-            sorted_rawemg_sta[col] = pd.DataFrame(row_dict)
-        sta_dict[mu] = sorted_rawemg_sta
+            sta_mat = np_cols[col][idx, :].mean(axis=0)
+            sorted_rawemg_sta[col] = pd.DataFrame(
+                sta_mat, columns=sorted_rawemg[col].columns,
+            )
+
+        return sorted_rawemg_sta
+
+    # Calculate STA on sorted_rawemg for every mu and put it into sta_dict[mu].
+    # Use prefer="threads" as the heavy lifting happens in NumPy C code that
+    # releases the GIL.
+    if multiprocessing:
+        res = Parallel(n_jobs=-1, prefer="threads")(
+            delayed(parallel)(mu) for mu in range(emgfile["NUMBER_OF_MUS"])
+        )
+    else:
+        res = [parallel(mu) for mu in range(emgfile["NUMBER_OF_MUS"])]
+
+    # Container of the STA for every MUs
+    # {0: {}, 1: {}, 2: {}, 3: {}}
+    sta_dict = {mu: res[mu] for mu in range(emgfile["NUMBER_OF_MUS"])}
 
     return sta_dict
 
 
-def st_muap(emgfile, sorted_rawemg, timewindow=50):
+def st_muap(emgfile, sorted_rawemg, timewindow=50, multiprocessing=True):
     """
     Generate spike triggered MUAPs of every MUs.
 
@@ -437,6 +476,9 @@ def st_muap(emgfile, sorted_rawemg, timewindow=50):
         matrix. Rows are stored in the dict as a pd.DataFrame.
     timewindow : int, default 50
         Timewindow to compute ST MUAPs in milliseconds.
+    multiprocessing : bool, default True
+        If True (default) parallel processing will be used to reduce execution
+        time.
 
     Returns
     -------
@@ -490,12 +532,25 @@ def st_muap(emgfile, sorted_rawemg, timewindow=50):
     halftime = round(timewindow_samples / 2)
     tottime = halftime * 2
 
-    # Container of the ST for every MUs
-    # {0: {}, 1: {}, 2: {}, 3: {} ...}
-    sta_dict = {mu: {} for mu in range(emgfile["NUMBER_OF_MUS"])}
+    # Convert each matrix column to a contiguous float32 2D array once for
+    # all the MUs. float32 halves the memory traffic and matches the
+    # precision of the stored RAW_SIGNAL.
+    np_cols = {
+        col: np.ascontiguousarray(
+            sorted_rawemg[col].to_numpy(dtype=np.float32)
+        )
+        for col in sorted_rawemg.keys()
+    }
 
-    # Calculate ST on sorted_rawemg for every mu and put it into sta_dict[mu]
-    for mu in sta_dict.keys():
+    # The NaN-status of a channel is fixed for the whole call, scan it once
+    # per column instead of once per empty MU
+    nan_cols = {
+        col: np.all(np.isnan(np_cols[col]), axis=0)
+        for col in np_cols.keys()
+    }
+
+    # ST function to run in parallel (1 job per MU)
+    def parallel(mu):
         # Check if there are firings in this MU
         if len(emgfile["MUPULSES"][mu]) == 0:
             warnings.warn(f"Empty MU {mu} in st_muap(). It will be set to 0.")
@@ -504,31 +559,61 @@ def st_muap(emgfile, sorted_rawemg, timewindow=50):
         sta_dict_cols = {}
         # Get MUPULSES for this MU
         thismups = emgfile["MUPULSES"][mu]
-        # Calculate ST for each channel in each column in sorted_rawemg
+
+        # Manage exception of no firings: set the STs to zeros (while
+        # preserving the empty channels) without entering the gather path.
+        if len(thismups) == 0:
+            for col in sorted_rawemg.keys():
+                sta_dict_crows = {}
+                for r_pos, row in enumerate(sorted_rawemg[col].columns):
+                    fill = np.nan if nan_cols[col][r_pos] else 0
+                    sta_dict_crows[row] = pd.DataFrame(
+                        {0: np.full((tottime, ), fill)}
+                    )
+                sta_dict_cols[col] = sta_dict_crows
+            return sta_dict_cols
+
+        # Precompute the windows indices (F x tottime) for the complete
+        # MUAPs once per MU. Incomplete MUAPs at the edges of the signal are
+        # excluded but the original firing positions are preserved as column
+        # names.
+        pulses = np.asarray(thismups)
+        emg_length = len(next(iter(np_cols.values())))
+        valid = (pulses >= halftime) & (pulses + halftime <= emg_length)
+        idx = (
+            pulses[valid][:, None]
+            + np.arange(-halftime, halftime)[None, :]
+        )
+        valid_pos = np.nonzero(valid)[0]
+
+        # Calculate ST for each channel in each column in sorted_rawemg.
+        # Gather all the MUAPs windows of the matrix column at once with a
+        # single fancy-indexing operation (F x tottime x channels).
         for col in sorted_rawemg.keys():
+            windows = np_cols[col][idx, :]
             # Container for the st of each channel (row) in that matrix column.
             sta_dict_crows = {}
-            for row in sorted_rawemg[col].columns:
-                emg_array = sorted_rawemg[col][row].to_numpy()
-                # Container for the pd.DataFrame with MUAPs of each channel.
-                crow_muaps = {}
-                # Calculate ST using NumPy vectorized operations
-                if len(thismups) > 0:  # Manage exception of no firings
-                    for pos, pulse in enumerate(thismups):
-                        muap = emg_array[pulse - halftime: pulse + halftime]
-                        # Avoid incomplete muaps
-                        if len(muap) == tottime:
-                            crow_muaps[pos] = muap
-                else:
-                    # If no firings, set STA to zeros (while preserving the
-                    # empty channel.
-                    if np.all(np.isnan(emg_array)):
-                        crow_muaps[0] = np.full((tottime, ), np.nan)
-                    else:
-                        crow_muaps[0] = np.full((tottime, ), 0)
-                sta_dict_crows[row] = pd.DataFrame(crow_muaps)
+            for r_pos, row in enumerate(sorted_rawemg[col].columns):
+                sta_dict_crows[row] = pd.DataFrame(
+                    windows[:, :, r_pos].T, columns=valid_pos,
+                )
             sta_dict_cols[col] = sta_dict_crows
-        sta_dict[mu] = sta_dict_cols
+
+        return sta_dict_cols
+
+    # Calculate ST on sorted_rawemg for every mu and put it into sta_dict[mu].
+    # Use prefer="threads" as the heavy lifting happens in NumPy C code that
+    # releases the GIL.
+    if multiprocessing:
+        res = Parallel(n_jobs=-1, prefer="threads")(
+            delayed(parallel)(mu) for mu in range(emgfile["NUMBER_OF_MUS"])
+        )
+    else:
+        res = [parallel(mu) for mu in range(emgfile["NUMBER_OF_MUS"])]
+
+    # Container of the ST for every MUs
+    # {0: {}, 1: {}, 2: {}, 3: {} ...}
+    sta_dict = {mu: res[mu] for mu in range(emgfile["NUMBER_OF_MUS"])}
 
     return sta_dict
 
@@ -562,12 +647,10 @@ def unpack_sta(sta_mu):
     # extract all the pd.DataFrames in a list
     dfs = [sta_mu[key] for key in keys]
 
-    # Merge in a single pd.DataFrame
-    df1 = reduce(
-        lambda left,
-        right: pd.merge(left, right, left_index=True, right_index=True),
-        dfs,
-    )
+    # Merge in a single pd.DataFrame. All the STA DataFrames share the same
+    # RangeIndex, so a single concat avoids the repeated index alignment of
+    # pairwise merges.
+    df1 = pd.concat(dfs, axis=1, copy=False)
 
     return df1, list(keys)
 
@@ -599,19 +682,19 @@ def pack_sta(df_sta, keys):
     # Detect the number of columns per pd.DataFrame (matrix columns)
     slice = int(np.ceil(len(df_sta.columns) / len(keys)))
 
-    # Pack the sta accordingly
+    # Pack the sta accordingly. Slice the underlying 2D ndarray and wrap the
+    # views without copying, skipping pandas' per-iloc indexing overhead.
+    arr = df_sta.to_numpy()
     packed_sta = {
-        k: df_sta.iloc[:, slice*p:slice*(p+1)] for p, k in enumerate(keys)
+        k: pd.DataFrame(
+            arr[:, slice*p:slice*(p+1)],
+            columns=df_sta.columns[slice*p:slice*(p+1)],
+            index=df_sta.index,
+            copy=False,
+        )
+        for p, k in enumerate(keys)
     }
 
-    # packed_sta = {
-    #     "col0": df_sta.iloc[:, 0:slice],
-    #     "col1": df_sta.iloc[:, slice:slice * 2],
-    #     "col2": df_sta.iloc[:, slice * 2: slice * 3],
-    #     "col3": df_sta.iloc[:, slice * 3: slice * 4],
-    #     "col4": df_sta.iloc[:, slice * 4: slice * 5],
-    # }
-
     return packed_sta
 
 
@@ -689,25 +772,27 @@ def align_by_xcorr(sta_mu1, sta_mu2, finalduration=0.5):
     101 NaN  -7.008870   1.708984 ... 25.634764  40.100101  43.009445
     """
 
-    # Obtain a pd.DataFrame for the 2d xcorr without empty column
+    # Obtain the 2d arrays for the 2d xcorr without empty columns
     # but mantain the original pd.DataFrame with empty column to return the
     # aligned STAs.
     df1, d_keys = unpack_sta(sta_mu1)
-    no_nan_sta1 = df1.dropna(axis=1, inplace=False)
+    arr1 = df1.to_numpy()
+    no_nan_sta1 = arr1[:, ~np.isnan(arr1).any(axis=0)]
     df2, d_keys = unpack_sta(sta_mu2)
-    no_nan_sta2 = df2.dropna(axis=1, inplace=False)
+    arr2 = df2.to_numpy()
+    no_nan_sta2 = arr2[:, ~np.isnan(arr2).any(axis=0)]
 
     # Compute 2dxcorr to identify a common lag/delay
-    normxcorr_df, _ = norm_twod_xcorr(
+    normxcorr, _ = norm_twod_xcorr(
         no_nan_sta1, no_nan_sta2, mode="same"
     )
 
     # Detect the time leads or lags from 2dxcorr
     corr_lags = signal.correlation_lags(
-        len(no_nan_sta1.index), len(no_nan_sta2.index), mode="same"
+        no_nan_sta1.shape[0], no_nan_sta2.shape[0], mode="same"
     )
-    normxcorr_df = normxcorr_df.set_index(corr_lags)
-    lag = normxcorr_df.idxmax().median()  # First signal compared to second
+    # First signal compared to second
+    lag = np.median(corr_lags[normxcorr.argmax(axis=0)])
 
     # Be sure that the lag/delay does not exceed values suitable for the final
     # expected duration.
@@ -715,29 +800,26 @@ def align_by_xcorr(sta_mu1, sta_mu2, finalduration=0.5):
     if lag > (finalduration_samples / 2):
         lag = finalduration_samples / 2
 
-    # Align the signals
-    dfmin = normxcorr_df.index.min()
-    dfmax = normxcorr_df.index.max()
+    # Align the signals. Since the lags form a contiguous integer range, the
+    # alignment reduces to integer offsets on the underlying arrays.
+    emg_length = len(df1.index)
+    offset = int(np.ceil(abs(lag)))
 
-    start1 = dfmin + abs(lag) if lag > 0 else dfmin
-    stop1 = dfmax if lag > 0 else dfmax - abs(lag)
+    start1 = offset if lag > 0 else 0
+    stop1 = emg_length if lag > 0 else emg_length - offset
 
-    start2 = dfmin + abs(lag) if lag < 0 else dfmin
-    stop2 = dfmax if lag < 0 else dfmax - abs(lag)
+    start2 = offset if lag < 0 else 0
+    stop2 = emg_length if lag < 0 else emg_length - offset
 
-    df1cut = df1.set_index(corr_lags).loc[start1:stop1, :]
-    df2cut = df2.set_index(corr_lags).loc[start2:stop2, :]
+    arr1cut = arr1[start1:stop1]
+    arr2cut = arr2[start2:stop2]
 
     # Cut the signal to respect the final duration
-    tocutstart = round((len(df1cut.index) - finalduration_samples) / 2)
-    tocutend = round(len(df1cut.index) - tocutstart)
-
-    df1cut = df1cut.iloc[tocutstart:tocutend, :]
-    df2cut = df2cut.iloc[tocutstart:tocutend, :]
+    tocutstart = round((len(arr1cut) - finalduration_samples) / 2)
+    tocutend = round(len(arr1cut) - tocutstart)
 
-    # Reset index to have a common index
-    df1cut.reset_index(drop=True, inplace=True)
-    df2cut.reset_index(drop=True, inplace=True)
+    df1cut = pd.DataFrame(arr1cut[tocutstart:tocutend], columns=df1.columns)
+    df2cut = pd.DataFrame(arr2cut[tocutstart:tocutend], columns=df2.columns)
 
     # Convert the STA to the original dict structure
     aligned_sta1 = pack_sta(df1cut, d_keys)
@@ -746,6 +828,28 @@ def align_by_xcorr(sta_mu1, sta_mu2, finalduration=0.5):
     return aligned_sta1, aligned_sta2
 
 
+def _unpacked_sta_array(sta_mu):
+    """
+    Unpack the STA of a single MU to a 2D array without the empty channels.
+
+    Parameters
+    ----------
+    sta_mu : dict
+        A dict containing the STA of a single MU.
+
+    Returns
+    -------
+    arr : np.ndarray
+        A 2D array (time x channels) with the STA of the MU, excluding the
+        channels containing np.nan.
+    """
+
+    df, _ = unpack_sta(sta_mu)
+    keep = df.notna().all(axis=0).to_numpy()
+
+    return df.iloc[:, keep].to_numpy()
+
+
 # TODO update examples for code="None"
 # This function exploits parallel processing for MUAPs alignment and xcorr
 def tracking(
@@ -1047,6 +1151,19 @@ def tracking(
 
     print("\nTracking started:")
 
+    # Without the per-pair alignment (custom MUAPs), the unpacked arrays do
+    # not change across pairs, convert them once per MU instead of N1 x N2
+    # times inside the loop.
+    if isinstance(custom_muaps, list):
+        arrays1 = {
+            mu: _unpacked_sta_array(sta_emgfile1[mu])
+            for mu in range(emgfile1["NUMBER_OF_MUS"])
+        }
+        arrays2 = {
+            mu: _unpacked_sta_array(sta_emgfile2[mu])
+            for mu in range(emgfile2["NUMBER_OF_MUS"])
+        }
+
     # Tracking function to run in parallel
     def parallel(mu_file1):  # Loop all the MUs of file 1
         # Dict to fill with the 2d cross-correlation results
@@ -1061,26 +1178,19 @@ def tracking(
                     sta_emgfile2[mu_file2],
                     finalduration=0.5
                 )
+                arr1 = _unpacked_sta_array(aligned_sta1)
+                arr2 = _unpacked_sta_array(aligned_sta2)
             else:
-                aligned_sta1 = sta_emgfile1[mu_file1]
-                aligned_sta2 = sta_emgfile2[mu_file2]
+                arr1 = arrays1[mu_file1]
+                arr2 = arrays2[mu_file2]
 
             # Second, compute 2d cross-correlation
-            df1, _ = unpack_sta(aligned_sta1)
-            df1.dropna(axis=1, inplace=True)
-            df2, _ = unpack_sta(aligned_sta2)
-            df2.dropna(axis=1, inplace=True)
             _, normxcorr_max = norm_twod_xcorr(
-                df1, df2, mode="full"
+                arr1, arr2, mode="full"
             )
 
             # Third, fill the tracking_res
-            if exclude_belowthreshold is False:
-                res["MU_file1"].append(mu_file1)
-                res["MU_file2"].append(mu_file2)
-                res["XCC"].append(normxcorr_max)
-
-            elif exclude_belowthreshold and normxcorr_max >= threshold:
+            if not exclude_belowthreshold or normxcorr_max >= threshold:
                 res["MU_file1"].append(mu_file1)
                 res["MU_file2"].append(mu_file2)
                 res["XCC"].append(normxcorr_max)
@@ -1088,7 +1198,10 @@ def tracking(
         return res
 
     if multiprocessing:
-        # Start parallel execution
+        # Start parallel execution. Keep the default (loky) backend: the
+        # per-pair work is dominated by pandas/Python bookkeeping in
+        # align_by_xcorr that holds the GIL, so threads do not scale here
+        # and worker processes are needed for a real speedup.
         res = Parallel(n_jobs=-1, verbose=1)(
             delayed(parallel)(mu_file1) for mu_file1 in range(emgfile1["NUMBER_OF_MUS"])
         )
@@ -1109,48 +1222,36 @@ def tracking(
             )
         print("\n")
 
-    # Convert res to pd.DataFrame
-    for pos, i in enumerate(res):
-        if pos == 0:
-            tracking_res = pd.DataFrame(i)
-        else:
-            new_tracking_res = pd.DataFrame(i)
-            # Check for empty df
-            if tracking_res.empty and not new_tracking_res.empty:
-                tracking_res = new_tracking_res
-            if not tracking_res.empty and not new_tracking_res.empty:
-                tracking_res = pd.concat([tracking_res, new_tracking_res])
-    tracking_res.reset_index(drop=True, inplace=True)
+    # Convert res to pd.DataFrame in a single concatenation
+    frames = [pd.DataFrame(i) for i in res]
+    frames = [f for f in frames if not f.empty]
+    if frames:
+        tracking_res = pd.concat(frames, ignore_index=True)
+    else:
+        tracking_res = pd.DataFrame(
+            {"MU_file1": [], "MU_file2": [], "XCC": []}
+        )
 
     # Filter the results
     if filter:
-        # Sort file by MUs in file 1 and XCC to have first the highest XCC
+        # Sort file by MUs in file 1 and XCC to have first the highest XCC,
+        # then keep only that row (highest XCC) for each MU in file 1.
         tracking_res = tracking_res.sort_values(
             by=["MU_file1", "XCC"], ascending=False,
         )
-
-        # Get unique MUs from file 1
-        unique = tracking_res["MU_file1"].unique()
-
-        res_unique = pd.DataFrame(columns=tracking_res.columns)
-
-        # Get the combo uf unique MUs from file 1 with MUs from file 2
-        for pos, mu1 in enumerate(unique):
-            this_res = tracking_res[tracking_res["MU_file1"] == mu1]
-            # Fill the result df with the first row (highest XCC)
-            res_unique.loc[pos, :] = this_res.iloc[0, :]
+        tracking_res = tracking_res.drop_duplicates(
+            subset="MU_file1", keep="first",
+        )
 
         # Now repeat the task with MUs from file 2
-        tracking_res = res_unique.sort_values(
+        tracking_res = tracking_res.sort_values(
             by=["MU_file2", "XCC"], ascending=False
         )
-        unique = tracking_res["MU_file2"].unique()
-        res_unique = pd.DataFrame(columns=tracking_res.columns)
-        for pos, mu2 in enumerate(unique):
-            this_res = tracking_res[tracking_res["MU_file2"] == mu2]
-            res_unique.loc[pos, :] = this_res.iloc[0, :]
+        tracking_res = tracking_res.drop_duplicates(
+            subset="MU_file2", keep="first",
+        )
 
-        tracking_res = res_unique.sort_values(by=["MU_file1"])
+        tracking_res = tracking_res.sort_values(by=["MU_file1"])
 
     else:
         # Sort file by MUs in file 1 and XCC to have first the highest XCC
@@ -1193,7 +1294,7 @@ def tracking(
                     showimmediately=False
                 )
 
-    plt.show()
+        plt.show()
 
     # Call the GUI and return the tracking_res
     if gui:
@@ -1317,6 +1418,14 @@ class Tracking_gui():
         addrefsig=True,
         csv_separator="\t",
     ):
+        # Lazy-import the GUI toolkit, so that headless use of this module
+        # (e.g., tracking with gui=False) never pays the Tk/TkAgg import
+        # cost.
+        global tk, ttk, FigureCanvasTkAgg
+        import tkinter as tk
+        from tkinter import ttk
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         # Define needed variables
         self.emgfile1 = emgfile1
         self.emgfile2 = emgfile2
@@ -1330,6 +1439,9 @@ class Tracking_gui():
         # Add included/excluded label to self.tracking_res
         self.tracking_res = self.tracking_res.assign(Inclusion="Included")
 
+        # Cache of the aligned STAs by MU pair, filled lazily in gui_plot
+        self._aligned_cache = {}
+
         # Define GUI structure
         # After that, set up the GUI
         self.root = tk.Tk()
@@ -1498,11 +1610,15 @@ class Tracking_gui():
 
         # MUAPs figure
         if self.align_muaps:
-            aligned_sta1, aligned_sta2 = align_by_xcorr(
+            # Align the pair only the first time it is selected, revisiting
+            # it from the dropdown reuses the cached alignment.
+            if (mu1, mu2) not in self._aligned_cache:
+                self._aligned_cache[(mu1, mu2)] = align_by_xcorr(
                     self.sta_emgfile1[mu1],
                     self.sta_emgfile2[mu2],
                     finalduration=0.5,
                 )
+            aligned_sta1, aligned_sta2 = self._aligned_cache[(mu1, mu2)]
             muaps_fig = plot_muaps(
                 sta_dict=[aligned_sta1, aligned_sta2],
                 title="",
@@ -1598,12 +1714,16 @@ class Tracking_gui():
                 foreground="green"
             )
 
-        # Update table
-        self.textbox.replace(
-            '1.0',
-            'end',
-            self.tracking_res.to_string(float_format="{:.2f}".format),
-        )
+        # Update only the edited row of the table. "Included" and "Excluded"
+        # have the same width, so the column layout cannot change and the
+        # full to_string rebuild is not needed.
+        row = pair + 2
+        line = self.textbox.get(f"{row}.0", f"{row}.end")
+        if self.tracking_res.loc[pair, "Inclusion"] == "Excluded":
+            line = line.replace("Included", "Excluded")
+        else:
+            line = line.replace("Excluded", "Included")
+        self.textbox.replace(f"{row}.0", f"{row}.end", line)
         self.textbox.tag_delete("highlight")
         self.highlight_row(pair)
 
@@ -1618,6 +1738,33 @@ class Tracking_gui():
         return self.tracking_res
 
 
+def _shallow_emgfile_copy(emgfile):
+    """
+    Copy an emgfile without duplicating the underlying signals.
+
+    Only the MU-keyed containers replaced when deleting MUs are copied, the
+    large signal entries (e.g., RAW_SIGNAL, REF_SIGNAL) are shared with the
+    input emgfile as they are never mutated.
+
+    Parameters
+    ----------
+    emgfile : dict
+        The dictionary containing the emgfile.
+
+    Returns
+    -------
+    new_emgfile : dict
+        A copy of the emgfile sharing the signal entries with the input.
+    """
+
+    new_emgfile = dict(emgfile)
+    for key in ("ACCURACY", "IPTS", "MUPULSES", "BINARY_MUS_FIRING"):
+        if key in new_emgfile:
+            new_emgfile[key] = copy.copy(new_emgfile[key])
+
+    return new_emgfile
+
+
 def remove_duplicates_between(
     emgfile1,
     emgfile2,
@@ -1846,9 +1993,10 @@ def remove_duplicates_between(
     >>> emg.asksavefile(emgfile2)
     """
 
-    # Work on deepcopies
-    emgfile1 = copy.deepcopy(emgfile1)
-    emgfile2 = copy.deepcopy(emgfile2)
+    # Work on copies. A shallow copy is enough, delete_mus never mutates
+    # its input and the signal entries are never touched here.
+    emgfile1 = _shallow_emgfile_copy(emgfile1)
+    emgfile2 = _shallow_emgfile_copy(emgfile2)
 
     # Get tracking results to identify duplicated MUs
     tracking_res = tracking(
@@ -1886,7 +2034,9 @@ def remove_duplicates_between(
     if which == "munumber":
         if emgfile1["NUMBER_OF_MUS"] >= emgfile2["NUMBER_OF_MUS"]:
             # Remove MUs from emgfile1
-            mus_to_remove = list(tracking_res_cleaned["MU_file1"])
+            mus_to_remove = np.unique(
+                tracking_res_cleaned["MU_file1"].to_numpy()
+            ).astype(int).tolist()
             emgfile1 = delete_mus(
                 emgfile=emgfile1, munumber=mus_to_remove, if_single_mu="remove"
             )
@@ -1895,7 +2045,9 @@ def remove_duplicates_between(
 
         else:
             # Remove MUs from emgfile2
-            mus_to_remove = list(tracking_res_cleaned["MU_file2"])
+            mus_to_remove = np.unique(
+                tracking_res_cleaned["MU_file2"].to_numpy()
+            ).astype(int).tolist()
 
             emgfile2 = delete_mus(
                 emgfile=emgfile2, munumber=mus_to_remove, if_single_mu="remove"
@@ -1905,19 +2057,17 @@ def remove_duplicates_between(
 
     elif which == "accuracy":
         # Create a list containing which MU to remove in which file based
-        # on ACCURACY value.
-        to_remove1 = []
-        to_remove2 = []
-        for i, row in tracking_res_cleaned.iterrows():
-            acc1 = emgfile1["ACCURACY"].loc[int(row["MU_file1"])]
-            acc2 = emgfile2["ACCURACY"].loc[int(row["MU_file2"])]
-
-            if acc1[0] <= acc2[0]:
-                # This MU should be removed from emgfile1
-                to_remove1.append(int(row["MU_file1"]))
-            else:
-                # This MU should be removed from emgfile2
-                to_remove2.append(int(row["MU_file2"]))
+        # on ACCURACY value. The paired accuracies are gathered and compared
+        # in one vectorised operation instead of row-by-row.
+        mu1 = tracking_res_cleaned["MU_file1"].to_numpy(dtype=int)
+        mu2 = tracking_res_cleaned["MU_file2"].to_numpy(dtype=int)
+        acc1 = emgfile1["ACCURACY"].to_numpy()[mu1, 0]
+        acc2 = emgfile2["ACCURACY"].to_numpy()[mu2, 0]
+
+        # Remove the MU of the pair with the lowest accuracy from its file
+        remove_from_1 = acc1 <= acc2
+        to_remove1 = mu1[remove_from_1].tolist()
+        to_remove2 = mu2[~remove_from_1].tolist()
 
         # Delete the MUs
         emgfile1 = delete_mus(
@@ -1935,7 +2085,7 @@ def remove_duplicates_between(
         )
 
 
-def xcc_sta(sta):
+def xcc_sta(sta, multiprocessing=True):
     """
     Cross-correlation between the STA of adjacent channels.
 
@@ -1948,6 +2098,9 @@ def xcc_sta(sta):
     sta : dict
         The dict containing the spike-triggered average (STA) of all the MUs
         computed with the function sta().
+    multiprocessing : bool, default True
+        If True (default) parallel processing will be used to compute the XCC
+        of the different MUs.
 
     Returns
     -------
@@ -1978,30 +2131,53 @@ def xcc_sta(sta):
     >>> xcc_sta = emg.xcc_sta(sta)
     """
 
-    # Obtain the structure of the sta_xcc dict
-    xcc_sta = copy.deepcopy(sta)
-
-    # Access all the MUs and matrix columns
-    for mu_number in sta:
+    # XCC function to run in parallel (1 job per MU)
+    def parallel(mu_number):
+        xcc_sta_cols = {}
         for matrix_col in sta[mu_number].keys():
             df = sta[mu_number][matrix_col]
+            arr = df.to_numpy()
 
-            # Reverse matrix columns to start pairs comparison from the last
-            reversed_col = list(df.columns)
-            reversed_col.reverse()
+            # Columns with less than 2 channels (possible with custom
+            # sorting orders) have no adjacent pair to correlate.
+            if arr.shape[1] < 2:
+                xcc_sta_cols[matrix_col] = pd.DataFrame(
+                    [np.full(arr.shape[1], np.nan)], columns=df.columns,
+                )
+                continue
+
+            # Normalise every channel once, the shared channel between
+            # consecutive pairs is then not re-normalised.
+            norms = np.linalg.norm(arr, axis=0)
+            # Avoid division by zero as in norm_xcorr
+            safe_norms = np.where(norms == 0, 1, norms)
+            normed = arr / safe_norms
+            normed[:, norms == 0] = 0
+
+            # XCC between adjacent channels. The first channel has no
+            # previous pair and is set to np.nan.
+            xccs = np.full(arr.shape[1], np.nan)
+            for pos in range(1, arr.shape[1]):
+                xccs[pos] = np.correlate(
+                    normed[:, pos], normed[:, pos - 1], mode="full",
+                ).max()
+
+            xcc_sta_cols[matrix_col] = pd.DataFrame(
+                [xccs], columns=df.columns,
+            )
 
-            for pos, col in enumerate(reversed_col):
-                if pos != len(reversed_col)-1:
-                    # Use np.ndarrays for performance
-                    this_c = df.loc[:, reversed_col[pos]].to_numpy()
-                    next_c = df.loc[:, reversed_col[pos+1]].to_numpy()
-                    xcc = norm_xcorr(sig1=this_c, sig2=next_c, out="max")
-                else:
-                    xcc = np.nan
+        return xcc_sta_cols
 
-                xcc_sta[mu_number][matrix_col][col] = xcc
+    # Calculate the XCC for every MU. Use prefer="threads" as the heavy
+    # lifting happens in NumPy C code that releases the GIL.
+    if multiprocessing:
+        res = Parallel(n_jobs=-1, prefer="threads")(
+            delayed(parallel)(mu_number) for mu_number in sta
+        )
+    else:
+        res = [parallel(mu_number) for mu_number in sta]
 
-            xcc_sta[mu_number][matrix_col] = xcc_sta[mu_number][matrix_col].drop_duplicates()
+    xcc_sta = {mu_number: r for mu_number, r in zip(sta, res)}
 
     return xcc_sta
 
@@ -2162,6 +2338,13 @@ class MUcv_gui():
         figsize=[25, 20],
         csv_separator="\t",
     ):
+        # Lazy-import the GUI toolkit, so that headless use of this module
+        # never pays the Tk/TkAgg import cost.
+        global tk, ttk, FigureCanvasTkAgg
+        import tkinter as tk
+        from tkinter import ttk
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         # On start, compute the necessary information
         self.emgfile = emgfile
         self.dd = double_diff(sorted_rawemg)
@@ -2175,6 +2358,16 @@ class MUcv_gui():
         self.figsize = figsize
         self.csv_separator = csv_separator
 
+        # Cache the STA as contiguous arrays once, every "Estimate" click
+        # then slices these directly instead of re-slicing the DataFrames.
+        self._st_arrays = {
+            mu: {
+                col: np.ascontiguousarray(df.to_numpy())
+                for col, df in cols.items()
+            }
+            for mu, cols in self.st.items()
+        }
+
         # After that, set up the GUI
         self.root = tk.Tk()
         self.root.title('MUs CV estimation')
@@ -2294,6 +2487,15 @@ class MUcv_gui():
         )
         button_est.grid(row=1, column=5, columnspan=1, sticky="we")
 
+        # Button to estimate all the MUs with the current channel selection
+        button_est_all = ttk.Button(
+            top_left_frm,
+            text="Estimate all",
+            command=self.compute_cv_all,
+            width=15,
+        )
+        button_est_all.grid(row=0, column=5, columnspan=1, sticky="we")
+
         # Configure column weights
         for c in range(6):
             if c == 1:
@@ -2385,41 +2587,45 @@ class MUcv_gui():
         self.res_df.to_clipboard(excel=True, sep=self.csv_separator)
 
     # Define functions for cv estimation
-    def compute_cv(self):
-        # Compute conduction velocity.
-
-        # Get the muaps of the selected columns.
-        sig = self.st[int(self.selectmu_cb.get())][self.col_cb.get()]
-        col_list = list(range(int(self.start_cb.get()), int(self.stop_cb.get())+1))
+    def _estimate_mu(self, mu, column, start, stop):
+        # Estimate CV, RMS and XCC of one MU on the selected channels.
 
-        sig = sig.iloc[:, col_list]
+        # Get the muaps of the selected columns from the cached arrays.
+        sig = self._st_arrays[mu][column][:, start: stop + 1]
 
         # Verify that the signal is correcly oriented
-        if len(sig) < len(sig.columns):
+        if sig.shape[0] < sig.shape[1]:
             raise ValueError(
                 "The number of signals exceeds the number of samples. Verify that each row represents a signal"
             )
 
         # Estimate CV
-        cv = estimate_cv_via_mle(emgfile=self.emgfile, signal=sig)
+        cv = estimate_cv_via_mle(
+            emgfile=self.emgfile, signal=pd.DataFrame(sig),
+        )
 
-        # Calculate RMS
-        sig = sig.to_numpy()
-        rms = np.mean(np.sqrt((np.mean(sig**2, axis=0))))
+        # Calculate RMS (averaged across channels). einsum fuses the square
+        # and the sum in one pass without a squared temporary.
+        rms = np.sqrt(np.einsum("ij,ij->j", sig, sig) / sig.shape[0]).mean()
 
-        # Update the self.res_df and the self.textbox
-        mu = int(self.selectmu_cb.get())
+        # Average XCC of the channel pairs in use
+        xcc_col_list = list(range(start + 1, stop + 1))
+        xcc = self.sta_xcc[mu][column].iloc[:, xcc_col_list].mean().mean()
+
+        return cv, rms, xcc
+
+    def _fill_results(self, mu, column, start, stop, cv, rms, xcc):
+        # Store the estimates of one MU in self.res_df.
 
         self.res_df.loc[mu, "CV"] = cv
         self.res_df.loc[mu, "RMS"] = rms
-
-        xcc_col_list = list(range(int(self.start_cb.get())+1, int(self.stop_cb.get())+1))
-        xcc = self.sta_xcc[mu][self.col_cb.get()].iloc[:, xcc_col_list].mean().mean()
         self.res_df.loc[mu, "XCC"] = xcc
+        self.res_df.loc[mu, "Column"] = str(column)
+        self.res_df.loc[mu, "From_Row"] = start
+        self.res_df.loc[mu, "To_Row"] = stop
 
-        self.res_df.loc[mu, "Column"] = str(self.col_cb.get())
-        self.res_df.loc[mu, "From_Row"] = int(self.start_cb.get())
-        self.res_df.loc[mu, "To_Row"] = int(self.stop_cb.get())
+    def _update_res_textbox(self):
+        # Refresh the results table in the GUI.
 
         self.textbox.replace(
             '1.0',
@@ -2428,3 +2634,37 @@ class MUcv_gui():
                 float_format="{:.2f}".format
             ),
         )
+
+    def compute_cv(self):
+        # Compute conduction velocity of the selected MU.
+
+        mu = int(self.selectmu_cb.get())
+        column = self.col_cb.get()
+        start = int(self.start_cb.get())
+        stop = int(self.stop_cb.get())
+
+        cv, rms, xcc = self._estimate_mu(mu, column, start, stop)
+
+        # Update the self.res_df and the self.textbox
+        self._fill_results(mu, column, start, stop, cv, rms, xcc)
+        self._update_res_textbox()
+
+    def compute_cv_all(self):
+        # Compute conduction velocity of all the MUs with the current
+        # channel selection.
+
+        column = self.col_cb.get()
+        start = int(self.start_cb.get())
+        stop = int(self.stop_cb.get())
+
+        # Estimate all the MUs in parallel. Use prefer="threads" as the
+        # heavy lifting happens in NumPy C code that releases the GIL.
+        res = Parallel(n_jobs=-1, prefer="threads")(
+            delayed(self._estimate_mu)(mu, column, start, stop)
+            for mu in self.all_mus
+        )
+
+        # Update the self.res_df and the self.textbox once
+        for mu, (cv, rms, xcc) in zip(self.all_mus, res):
+            self._fill_results(mu, column, start, stop, cv, rms, xcc)
+        self._update_res_textbox()
@@ -6,12 +6,14 @@ shortcuts necessary to operate with the HD-EMG recordings.
 """
 
 import copy
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import signal
 from scipy.stats import iqr
 from sklearn.svm import SVR
+from joblib import Parallel, delayed, effective_n_jobs
 import warnings
 from openhdemg.library.mathtools import compute_sil
 
@@ -113,8 +115,13 @@ def showselect(emgfile, how="ref_signal", title="", titlesize=12, nclic=2):
 
     plt.close()
 
-    points = [round(point[0]) for point in ginput_res]
-    points.sort()
+    if len(ginput_res) == 0:
+        points = []
+    else:
+        arr = np.asarray(ginput_res, dtype=np.float64)
+        points = np.rint(arr[:, 0]).astype(np.int64)
+        points.sort()
+        points = points.tolist()
 
     if nclic > 0 and nclic != len(points):
         raise ValueError("Wrong number of inputs, read the title")
@@ -122,6 +129,35 @@ def showselect(emgfile, how="ref_signal", title="", titlesize=12, nclic=2):
     return points
 
 
+def _resize_df(values, columns, start_, end_):
+    """
+    Slice the values of a pd.DataFrame positionally and rebuild it.
+
+    Works on the underlying values to avoid the label lookup and index copy
+    of .loc followed by reset_index. As with .loc, end_ is included.
+    """
+
+    return pd.DataFrame(values[start_:end_ + 1], columns=columns)
+
+
+def _extract_resize_arrays(emgfile):
+    """
+    Pre-extract the underlying ndarrays resized by resize_emgfile.
+
+    Extracting the arrays once allows cutting multiple sections from the same
+    file (e.g., in EMGFileSectionsIterator.split) without repeated
+    DataFrame-to-array conversions.
+    """
+
+    arrays = {"REF_SIGNAL": emgfile["REF_SIGNAL"].to_numpy()}
+    if emgfile["SOURCE"] in ["DEMUSE", "OTB", "CUSTOMCSV", "DELSYS"]:
+        arrays["RAW_SIGNAL"] = emgfile["RAW_SIGNAL"].to_numpy()
+        arrays["IPTS"] = emgfile["IPTS"].to_numpy()
+        arrays["BINARY_MUS_FIRING"] = emgfile["BINARY_MUS_FIRING"].to_numpy()
+
+    return arrays
+
+
 def create_binary_firings(emg_length, number_of_mus, mupulses):
     """
     Create a binary representation of the MU firing.
@@ -149,17 +185,19 @@ def create_binary_firings(emg_length, number_of_mus, mupulses):
     if not isinstance(mupulses, list):
         raise ValueError("mupulses is not a list of ndarrays")
 
-    # Initialise a pd.DataFrame with zeros
-    binary_MUs_firing = pd.DataFrame(
-        np.zeros((emg_length, number_of_mus), dtype=int)
-    )
+    # Initialise the binary representation with zeros and set all the firing
+    # points in a single scatter assignment instead of a per-MU loop.
+    binary_MUs_firing = np.zeros((emg_length, number_of_mus), dtype=int)
 
-    for mu in range(number_of_mus):
-        if len(mupulses[mu]) > 0:
-            firing_points = mupulses[mu].astype(int)
-            binary_MUs_firing.iloc[firing_points, mu] = 1
+    lengths = [len(mupulses[mu]) for mu in range(number_of_mus)]
+    if sum(lengths) > 0:
+        rows = np.concatenate(
+            [mupulses[mu] for mu in range(number_of_mus)]
+        ).astype(int)
+        cols = np.repeat(np.arange(number_of_mus), lengths)
+        binary_MUs_firing[rows, cols] = 1
 
-    return binary_MUs_firing
+    return pd.DataFrame(binary_MUs_firing)
 
 
 def mupulses_from_binary(binarymusfiring):
@@ -175,21 +213,14 @@ def mupulses_from_binary(binarymusfiring):
     -------
     MUPULSES : list
         A list of ndarrays containing the firing time (in samples) of each MU.
+        The arrays have np.intp dtype (the platform int), matching what the
+        rest of the library expects for MUPULSES.
     """
 
-    # Create empty list of lists to fill with ndarrays containing the MUPULSES
-    # (point of firing)
-    numberofMUs = len(binarymusfiring.columns)
-    MUPULSES = [[] for _ in range(numberofMUs)]
-
-    for mu in binarymusfiring:  # Loop all the MUs
-        my_ndarray = []
-        for idx, x in binarymusfiring[mu].items():  # Loop the MU firing times
-            if x > 0:
-                my_ndarray.append(idx)
-                # Take the firing time and add it to the ndarray
-
-        MUPULSES[mu] = np.array(my_ndarray)
+    # Collect the position of the nonzero samples (points of firing) of each
+    # MU directly from the underlying array.
+    arr = binarymusfiring.to_numpy()
+    MUPULSES = [np.flatnonzero(arr[:, mu]) for mu in range(arr.shape[1])]
 
     return MUPULSES
 
@@ -200,6 +231,7 @@ def resize_emgfile(
     how="ref_signal",
     accuracy="recalculate",
     ignore_negative_ipts=False,
+    sil_subsample=None,
 ):
     """
     Resize all the components in the emgfile.
@@ -239,6 +271,11 @@ def resize_emgfile(
         This is particularly important for compensating sources with large
         negative components. This parameter is considered only if
         accuracy=="recalculate".
+    sil_subsample : int or None, default None
+        If set, the silhouette score recalculation subsamples peak and noise
+        clusters larger than sil_subsample (see compute_sil). This bounds the
+        recalculation time on long recordings with negligible impact on the
+        score. This parameter is considered only if accuracy=="recalculate".
 
     Returns
     -------
@@ -294,13 +331,48 @@ def resize_emgfile(
         )
         start_, end_ = points[0], points[1]
 
+    return _resize_emgfile_from_arrays(
+        emgfile,
+        _extract_resize_arrays(emgfile),
+        start_,
+        end_,
+        accuracy=accuracy,
+        ignore_negative_ipts=ignore_negative_ipts,
+        sil_subsample=sil_subsample,
+    )
+
+
+def _resize_emgfile_from_arrays(
+    emgfile,
+    arrays,
+    start_,
+    end_,
+    accuracy="recalculate",
+    ignore_negative_ipts=False,
+    sil_subsample=None,
+):
+    """
+    Resize the emgfile based on pre-extracted ndarrays.
+
+    Performs the resizing of resize_emgfile working on the arrays returned
+    by _extract_resize_arrays, so that the DataFrame-to-array conversion
+    cost is paid only once when multiple sections are cut from the same file.
+    """
+
     # Double check that start_, end_ are within the real range.
     if start_ < 0:
         start_ = 0
     # Continued inside if...
 
-    # Create the object to store the resized emgfile.
-    rs_emgfile = copy.deepcopy(emgfile)
+    # Create the object to store the resized emgfile. A shallow copy is
+    # sufficient because the resized containers are reassigned (not modified
+    # in-place); only the containers that are altered in-place (MUPULSES,
+    # ACCURACY) need their own copy.
+    rs_emgfile = dict(emgfile)
+    if "MUPULSES" in rs_emgfile:
+        rs_emgfile["MUPULSES"] = copy.copy(rs_emgfile["MUPULSES"])
+    if "ACCURACY" in rs_emgfile:
+        rs_emgfile["ACCURACY"] = rs_emgfile["ACCURACY"].copy()
 
     if emgfile["SOURCE"] in ["DEMUSE", "OTB", "CUSTOMCSV", "DELSYS"]:
         """
@@ -322,51 +394,58 @@ def resize_emgfile(
         """
 
         # Double check that start_, end_ are within the real range.
-        if end_ > emgfile["RAW_SIGNAL"].shape[0]:
-            end_ = emgfile["RAW_SIGNAL"].shape[0]
-
-        # Resize the reference signal and identify the first value of the
-        # index to resize the mupulses. Then, reset the index.
-        rs_emgfile["REF_SIGNAL"] = rs_emgfile["REF_SIGNAL"].loc[start_:end_]
-        rs_emgfile["REF_SIGNAL"] = rs_emgfile["REF_SIGNAL"].reset_index(drop=True)
-        rs_emgfile["RAW_SIGNAL"] = rs_emgfile["RAW_SIGNAL"].loc[start_:end_]
-        first_idx = rs_emgfile["RAW_SIGNAL"].index[0]
-        rs_emgfile["RAW_SIGNAL"] = rs_emgfile["RAW_SIGNAL"].reset_index(drop=True)
-        rs_emgfile["IPTS"] = rs_emgfile["IPTS"].loc[start_:end_].reset_index(drop=True)
+        if end_ > arrays["RAW_SIGNAL"].shape[0]:
+            end_ = arrays["RAW_SIGNAL"].shape[0]
+
+        # Resize the signals positionally and identify the first value of the
+        # original index to resize the mupulses.
+        first_idx = start_
+        rs_emgfile["REF_SIGNAL"] = _resize_df(
+            arrays["REF_SIGNAL"], emgfile["REF_SIGNAL"].columns, start_, end_
+        )
+        rs_emgfile["RAW_SIGNAL"] = _resize_df(
+            arrays["RAW_SIGNAL"], emgfile["RAW_SIGNAL"].columns, start_, end_
+        )
+        rs_emgfile["IPTS"] = _resize_df(
+            arrays["IPTS"], emgfile["IPTS"].columns, start_, end_
+        )
         rs_emgfile["EMG_LENGTH"] = int(len(rs_emgfile["RAW_SIGNAL"].index))
-        rs_emgfile["BINARY_MUS_FIRING"] = (
-            rs_emgfile["BINARY_MUS_FIRING"].loc[start_:end_].reset_index(drop=True)
+        rs_emgfile["BINARY_MUS_FIRING"] = _resize_df(
+            arrays["BINARY_MUS_FIRING"],
+            emgfile["BINARY_MUS_FIRING"].columns,
+            start_,
+            end_,
         )
 
         for mu in range(rs_emgfile["NUMBER_OF_MUS"]):
-            # Mask the array based on a filter and return the values in an
-            # array. However, make sure that all the numbers are int32 to
+            # MUPULSES are sorted, so the window [start_, end_) can be
+            # located with searchsorted and extracted with a slice instead
+            # of a boolean mask. Make sure that all the numbers are int32 to
             # prevent falling to int16 when small sections are resized.
-            # This may cause overflow.
-            rs_emgfile["MUPULSES"][mu] = rs_emgfile["MUPULSES"][mu].astype(
-                np.int32
-            )
-
-            rs_emgfile["MUPULSES"][mu] = (
-                rs_emgfile["MUPULSES"][mu][
-                    (rs_emgfile["MUPULSES"][mu] >= start_)
-                    & (rs_emgfile["MUPULSES"][mu] < end_)
-                ]
-                - first_idx
-            )
+            # This may cause overflow. np.asarray skips the copy when the
+            # array is already int32.
+            mp = np.asarray(rs_emgfile["MUPULSES"][mu], dtype=np.int32)
+            first, last = np.searchsorted(mp, [start_, end_])
+            rs_emgfile["MUPULSES"][mu] = mp[first:last] - first_idx
 
         # Compute SIL or leave original ACCURACY
         if accuracy == "recalculate":
             if rs_emgfile["NUMBER_OF_MUS"] > 0:
                 if not rs_emgfile["IPTS"].empty:
-                    # Calculate SIL
-                    for mu in range(rs_emgfile["NUMBER_OF_MUS"]):
-                        res = compute_sil(
-                            ipts=rs_emgfile["IPTS"][mu],
+                    # Calculate SIL (1 job per MU). Use prefer="threads" as
+                    # the heavy lifting happens in NumPy C code that releases
+                    # the GIL. Slice IPTS once instead of once per MU.
+                    ipts_vals = arrays["IPTS"][start_:end_ + 1]
+                    res = Parallel(n_jobs=-1, prefer="threads")(
+                        delayed(compute_sil)(
+                            ipts=ipts_vals[:, mu],
                             mupulses=rs_emgfile["MUPULSES"][mu],
                             ignore_negative_ipts=ignore_negative_ipts,
-                        )
-                        rs_emgfile["ACCURACY"].iloc[mu] = res
+                            subsample=sil_subsample,
+                        ) for mu in range(rs_emgfile["NUMBER_OF_MUS"])
+                    )
+                    for mu in range(rs_emgfile["NUMBER_OF_MUS"]):
+                        rs_emgfile["ACCURACY"].iloc[mu] = res[mu]
 
                 else:
                     raise ValueError(
@@ -388,11 +467,12 @@ def resize_emgfile(
 
     elif emgfile["SOURCE"] in ["OTB_REFSIG", "CUSTOMCSV_REFSIG", "DELSYS_REFSIG"]:
         # Double check that start_, end_ are within the real range.
-        if end_ > emgfile["REF_SIGNAL"].shape[0]:
-            end_ = emgfile["REF_SIGNAL"].shape[0]
+        if end_ > arrays["REF_SIGNAL"].shape[0]:
+            end_ = arrays["REF_SIGNAL"].shape[0]
 
-        rs_emgfile["REF_SIGNAL"] = rs_emgfile["REF_SIGNAL"].loc[start_:end_]
-        rs_emgfile["REF_SIGNAL"] = rs_emgfile["REF_SIGNAL"].reset_index(drop=True)
+        rs_emgfile["REF_SIGNAL"] = _resize_df(
+            arrays["REF_SIGNAL"], emgfile["REF_SIGNAL"].columns, start_, end_
+        )
 
         return rs_emgfile, start_, end_
 
@@ -400,6 +480,61 @@ def resize_emgfile(
         raise ValueError("\nFile source not recognised\n")
 
 
+def _validate_iterate_args(funcs, args_list, kwargs_list, n_sections):
+    """
+    Validate the input of EMGFileSectionsIterator.iterate.
+
+    Checks types and lengths in a single pass and raises a ValueError with
+    the appropriate message on the first failing condition.
+    """
+
+    if not isinstance(funcs, list):
+        raise ValueError("Funcs must be a list")
+    if not isinstance(args_list, list):
+        raise ValueError("args_list must be a list")
+    if not isinstance(kwargs_list, list):
+        raise ValueError("kwargs_list must be a list")
+
+    n_funcs = len(funcs)
+    n_args = len(args_list)
+    n_kwargs = len(kwargs_list)
+
+    args_err = (
+        "args_list must be a list containing 1 list of " +
+        "arguments for each function."
+    )
+    kwargs_err = (
+        "kwargs_list must be a list containing 1 dict of " +
+        "keyword arguments for each function."
+    )
+
+    # Manage multiple functions
+    if n_funcs > 1:
+        if n_funcs != n_sections:
+            raise ValueError(
+                "funcs must be a list containing 1 function to be " +
+                "applied to all the sections or 1 function for each " +
+                "section."
+            )
+        if n_args > 0:
+            if not isinstance(args_list[0], list) or n_args != n_sections:
+                raise ValueError(args_err)
+        if n_kwargs > 0:
+            if not isinstance(kwargs_list[0], dict) or n_kwargs != n_sections:
+                raise ValueError(kwargs_err)
+
+    elif n_funcs == 1:
+        if n_args > 1 or (n_args == 1 and not isinstance(args_list[0], list)):
+            raise ValueError(args_err)
+        if n_kwargs > 1 or (
+            n_kwargs == 1 and not isinstance(kwargs_list[0], dict)
+        ):
+            raise ValueError(kwargs_err)
+
+    else:
+        raise ValueError("No function provided to iterate")
+
+
 class EMGFileSectionsIterator:
     """
     An iterator for splitting a file into sections and performing actions.
@@ -565,30 +700,32 @@ class EMGFileSectionsIterator:
             nclic=nclic,
         )
 
-        # Double check that split_points are within the real range.
-        points_below = [x for x in split_points if x < 0]
-        if len(points_below) > 1:
+        # Double check that split_points are within the real range. A single
+        # NumPy pass counts the out-of-range points on both sides.
+        arr = np.asarray(split_points, dtype=np.int64)
+        n_below = int((arr < 0).sum())
+        if n_below > 1:
             raise ValueError(
                 "More than 1 point has been selected below 0."
             )
-        elif len(points_below) == 1:
-            if split_points[0] < 0:
-                split_points[0] = 0
+        elif n_below == 1:
+            if arr[0] < 0:
+                arr[0] = 0
             else:
                 raise ValueError(
                     "There are points below 0 different from the firt " +
                     "element of the list, check points beeing sorted."
                 )
 
-        points_above = [x for x in split_points if x > self.file_length]
-        if len(points_above) > 1:
+        n_above = int((arr > self.file_length).sum())
+        if n_above > 1:
             raise ValueError(
                 "More than 1 point has been selected after the end of the " +
                 "signal."
             )
-        elif len(points_above) == 1:
-            if split_points[-1] > self.file_length:
-                split_points[-1] = self.file_length
+        elif n_above == 1:
+            if arr[-1] > self.file_length:
+                arr[-1] = self.file_length
             else:
                 raise ValueError(
                     "There are points after the end of the file different " +
@@ -596,7 +733,7 @@ class EMGFileSectionsIterator:
                     "sorted."
                 )
 
-        self.split_points = split_points
+        self.split_points = arr.tolist()
 
     def set_split_points_by_equal_spacing(self, n_sections):
         """
@@ -628,10 +765,11 @@ class EMGFileSectionsIterator:
         [0, 22186, 44373, 66560]
         """
 
+        # Integer arithmetic guarantees monotonic, in-range points without
+        # the float64 intermediate of np.linspace.
         space = self.file_length
-        self.split_points = list(
-            np.linspace(0, space, n_sections + 1, dtype=int)
-        )
+        k = np.arange(n_sections + 1, dtype=np.int64)
+        self.split_points = ((k * space) // n_sections).tolist()
 
     def set_split_points_by_time(self, time_window, drop_shorter=False):
         """
@@ -687,12 +825,17 @@ class EMGFileSectionsIterator:
         space = self.file_length
 
         step = int(round(time_window * fsamp))
-        self.split_points = list(range(0, space + 1, step))
+        if step <= 0:
+            raise ValueError(
+                "time_window must correspond to at least 1 sample."
+            )
+        pts = np.arange(0, space + 1, step)
 
         # Append the last point if it's missing and drop_shorter is False
-        if self.split_points[-1] != space:
-            if not drop_shorter:
-                self.split_points.append(space)
+        if pts[-1] != space and not drop_shorter:
+            pts = np.append(pts, space)
+
+        self.split_points = pts.tolist()
 
     def set_split_points_by_samples(self, samples_window, drop_shorter=False):
         """
@@ -745,12 +888,15 @@ class EMGFileSectionsIterator:
 
         space = self.file_length
         step = samples_window
-        self.split_points = list(range(0, space + 1, step))
+        if step <= 0:
+            raise ValueError("samples_window must be at least 1 sample.")
+        pts = np.arange(0, space + 1, step)
 
         # Append the last point if it's missing and drop_shorter is False
-        if self.split_points[-1] != space:
-            if not drop_shorter:
-                self.split_points.append(space)
+        if pts[-1] != space and not drop_shorter:
+            pts = np.append(pts, space)
+
+        self.split_points = pts.tolist()
 
     def set_split_points_by_list(self, split_points):
         """
@@ -782,7 +928,12 @@ class EMGFileSectionsIterator:
 
         self.split_points = split_points
 
-    def split(self, accuracy="recalculate", ignore_negative_ipts=False):
+    def split(
+        self,
+        accuracy="recalculate",
+        ignore_negative_ipts=False,
+        sil_subsample=None,
+    ):
         """
         Splits the file into sections using the set split points.
 
@@ -803,6 +954,10 @@ class EMGFileSectionsIterator:
             This is particularly important for compensating sources with large
             negative components. This parameter is considered only if
             accuracy=="recalculate".
+        sil_subsample : int or None, default None
+            If set, the silhouette score recalculation subsamples peak and
+            noise clusters larger than sil_subsample (see compute_sil). This
+            parameter is considered only if accuracy=="recalculate".
 
         Returns
         -------
@@ -821,16 +976,23 @@ class EMGFileSectionsIterator:
         4
         """
 
+        # Extract the underlying arrays once and reuse them for all the
+        # sections instead of converting the DataFrames for each section.
+        arrays = _extract_resize_arrays(self.file)
+
         self.sections = []
         for start, end in zip(self.split_points[:-1], self.split_points[1:]):
-            rs_emgfile, _, _ = resize_emgfile(
-                self.file, area=[start, end],
+            rs_emgfile, _, _ = _resize_emgfile_from_arrays(
+                self.file, arrays, start, end,
                 accuracy=accuracy,
                 ignore_negative_ipts=ignore_negative_ipts,
+                sil_subsample=sil_subsample,
             )
             self.sections.append(rs_emgfile)
 
-    def iterate(self, funcs=[], args_list=[[]], kwargs_list=[{}], **kwargs):
+    def iterate(
+        self, funcs=[], args_list=[[]], kwargs_list=[{}], n_jobs=1, **kwargs,
+    ):
         """
         Apply a collection of functions to the split sections, each with its
         own arguments.
@@ -850,6 +1012,12 @@ class EMGFileSectionsIterator:
             A list where each element is a dictionary of keyword arguments to
             be passed to the corresponding function in `funcs`. Must have the
             same length as `funcs`.
+        n_jobs : int, default 1
+            The number of sections to process in parallel (1 job per
+            section). If 1 (default), the sections are processed serially.
+            If -1, all the available cores are used. Parallel execution uses
+            threads, which speeds up functions spending their time in
+            NumPy/pandas C code.
         **kwargs
             Additional keyword arguments that are passed to all functions in
             `funcs`. If `funcs` contains only 1 function, **kwargs can be used
@@ -910,86 +1078,42 @@ class EMGFileSectionsIterator:
         """
 
         # Extensive input checking to help using the iterate function.
-        if not isinstance(funcs, list):
-            raise ValueError("Funcs must be a list")
-        if not isinstance(args_list, list):
-            raise ValueError("args_list must be a list")
-        if not isinstance(kwargs_list, list):
-            raise ValueError("kwargs_list must be a list")
-
-        # Manage multiple functions
-        if len(funcs) > 1:
-            if len(funcs) != len(self.sections):
-                raise ValueError(
-                    "funcs must be a list containing 1 function to be " +
-                    "applied to all the sections or 1 function for each " +
-                    "section."
-                )
-            if len(args_list) > 0:
-                if not isinstance(args_list[0], list):
-                    raise ValueError(
-                        "args_list must be a list containing 1 list of " +
-                        "arguments for each function."
-                    )
-                if len(args_list) != len(self.sections):
-                    raise ValueError(
-                        "args_list must be a list containing 1 list of " +
-                        "arguments for each function."
-                    )
-            if len(kwargs_list) > 0:
-                if not isinstance(kwargs_list[0], dict):
-                    raise ValueError(
-                        "kwargs_list must be a list containing 1 dict of " +
-                        "keyword arguments for each function."
-                    )
-                if len(kwargs_list) != len(self.sections):
-                    raise ValueError(
-                        "kwargs_list must be a list containing 1 dict of " +
-                        "keyword arguments for each function."
-                    )
-
-        elif len(funcs) == 1:
-            if len(args_list) == 1:
-                if not isinstance(args_list[0], list):
-                    raise ValueError(
-                        "args_list must be a list containing 1 list of " +
-                        "arguments for each function."
-                    )
-            elif len(args_list) > 1:
-                raise ValueError(
-                    "args_list must be a list containing 1 list of " +
-                    "arguments for each function."
-                )
+        _validate_iterate_args(funcs, args_list, kwargs_list, len(self.sections))
 
-            if len(kwargs_list) == 1:
-                if not isinstance(kwargs_list[0], dict):
-                    raise ValueError(
-                        "kwargs_list must be a list containing 1 dict of " +
-                        "keyword arguments for each function."
-                    )
-            elif len(kwargs_list) > 1:
-                raise ValueError(
-                    "kwargs_list must be a list containing 1 dict of " +
-                    "keyword arguments for each function."
-                )
-
-        else:
-            raise ValueError("No function provided to iterate")
-
-        # Proagate single function to fit the number of sections
+        # Proagate single function to fit the number of sections. In this
+        # broadcast case every section receives the same keyword arguments,
+        # so the dict merge is performed once instead of once per section.
         if len(funcs) == 1 and len(self.sections) > 1:
             funcs = [funcs[0] for _ in self.sections]
             args_list = [args_list[0] for _ in self.sections]
-            kwargs_list = [kwargs_list[0] for _ in self.sections]
+            shared_kwargs = {**kwargs_list[0], **kwargs}
+            combined_kwargs_list = [shared_kwargs for _ in self.sections]
+        else:
+            combined_kwargs_list = [
+                {**func_kwargs, **kwargs} for func_kwargs in kwargs_list
+            ]
 
         # Calculate the results for each section
-        for idx, section in enumerate(self.sections):
-            func = funcs[idx]
-            func_args = args_list[idx]
-            func_kwargs = kwargs_list[idx]
-            combined_kwargs = {**func_kwargs, **kwargs}
-            result = func(section, *func_args, **combined_kwargs)
-            self.results.append(result)
+        if n_jobs == 1:
+            for idx, section in enumerate(self.sections):
+                func = funcs[idx]
+                func_args = args_list[idx]
+                combined_kwargs = combined_kwargs_list[idx]
+                result = func(section, *func_args, **combined_kwargs)
+                self.results.append(result)
+        else:
+            # 1 job per section. Use prefer="threads" as the analysis
+            # functions typically spend their time in NumPy/pandas C code
+            # that releases the GIL.
+            res = Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(funcs[idx])(
+                    section,
+                    *args_list[idx],
+                    **combined_kwargs_list[idx],
+                )
+                for idx, section in enumerate(self.sections)
+            )
+            self.results.extend(res)
 
     def merge_dataframes(self, method="long", fillna=None, agg_func=None):
         """
@@ -1157,66 +1281,125 @@ class EMGFileSectionsIterator:
                 "All elements in `self.results` must be pd.DataFrames."
             )
 
-        # Optionally fill NaN values
+        # Optionally fill NaN values. Null-free frames are passed through by
+        # reference and self.results is left untouched.
         if fillna is not None:
-            self.results = [df.fillna(fillna) for df in self.results]
+            results = [
+                df.fillna(fillna) if df.isna().any().any() else df
+                for df in self.results
+            ]
+        else:
+            results = self.results
+
+        # Short-circuit the single-DataFrame case for the methods where the
+        # result is the DataFrame itself: concat/groupby would only perform
+        # a full copy. std and cv keep the regular path (their result is NaN
+        # with a single sample per group).
+        if len(results) == 1:
+            if method in ["average", "median", "sum", "min", "max"]:
+                return results[0].copy()
+            elif method == "long":
+                merged_df = results[0].reset_index(names="original_idx")
+                merged_df.insert(0, "source_idx", 0)
+                return merged_df
+
+        # Fast path for the simple reductions when all the DataFrames share
+        # shape, columns and index (the common case of sections analysed
+        # with the same function): stack the values into a 3-D array and
+        # reduce along the sections axis, skipping concat/groupby entirely.
+        # The nan-aware reducers match the groupby NaN handling (std with
+        # ddof=1, as pandas).
+        reducers = {
+            "average": (np.nanmean, {}),
+            "median": (np.nanmedian, {}),
+            "sum": (np.nansum, {}),
+            "min": (np.nanmin, {}),
+            "max": (np.nanmax, {}),
+            "std": (np.nanstd, {"ddof": 1}),
+        }
+        if method in reducers:
+            first = results[0]
+            aligned = all(
+                df.shape == first.shape
+                and df.columns.equals(first.columns)
+                and df.index.equals(first.index)
+                for df in results[1:]
+            )
+            if aligned:
+                arr = np.stack([df.to_numpy() for df in results], axis=0)
+                if np.issubdtype(arr.dtype, np.number):
+                    reducer, reducer_kwargs = reducers[method]
+                    # The nan-reducers warn on all-NaN slices (nanmin,
+                    # nanmax) and on single-section std with ddof=1; the
+                    # groupby path returns NaN silently there, so silence
+                    # the warnings for the same outcome.
+                    with warnings.catch_warnings():
+                        warnings.simplefilter(
+                            "ignore", category=RuntimeWarning,
+                        )
+                        reduced = reducer(arr, axis=0, **reducer_kwargs)
+                    return pd.DataFrame(
+                        reduced,
+                        index=first.index,
+                        columns=first.columns,
+                        copy=False,
+                    )
 
-        # Stack DataFrames along axis=0 for operations like std and cv
-        merged_stack = pd.concat(
-            self.results, axis=0, keys=range(len(self.results)),
-        )
+        # Stack DataFrames along axis=0 for operations like std and cv. Not
+        # needed for the long and custom methods, which work on the list.
+        merged_stack = None
+        if method not in ["long", "custom"]:
+            merged_stack = pd.concat(
+                results, axis=0, keys=range(len(results)), copy=False,
+            )
 
         if method == "average":
-            merged_df = merged_stack.groupby(level=1).mean()
+            merged_df = merged_stack.groupby(level=1, sort=False).mean()
 
         elif method == "median":
-            merged_df = merged_stack.groupby(level=1).median()
+            merged_df = merged_stack.groupby(level=1, sort=False).median()
 
         elif method == "sum":
-            merged_df = merged_stack.groupby(level=1).sum()
+            merged_df = merged_stack.groupby(level=1, sort=False).sum()
 
         elif method == "min":
-            merged_df = merged_stack.groupby(level=1).min()
+            merged_df = merged_stack.groupby(level=1, sort=False).min()
 
         elif method == "max":
-            merged_df = merged_stack.groupby(level=1).max()
+            merged_df = merged_stack.groupby(level=1, sort=False).max()
 
         elif method == "std":
-            merged_df = merged_stack.groupby(level=1).std()
+            merged_df = merged_stack.groupby(level=1, sort=False).std()
 
         elif method == "cv":
-            mean_df = merged_stack.groupby(level=1).mean()
-            std_df = merged_stack.groupby(level=1).std()
-            merged_df = std_df / mean_df
+            # Compute mean and std in a single groupby pass.
+            agg_df = merged_stack.groupby(level=1, sort=False).agg(["mean", "std"])
+            merged_df = (
+                agg_df.xs("std", level=1, axis=1)
+                / agg_df.xs("mean", level=1, axis=1)
+            )
 
         elif method == "long":
             # Preserve original index (often indicating the MU number) by
             # renaming it to 'original_idx', and assign source index to detect
-            # from which DataFrame the results come from.
-            merged_df = pd.concat(
-                [
-                    df.reset_index().rename(
-                        columns={"index": "original_idx"}
-                    ).assign(source_idx=i)
-                    for i, df in enumerate(self.results)
-                ],
-                ignore_index=True
-            )
-
-            # Ensure consistent column order
-            cols = ["source_idx", "original_idx"] + [
-                col for col in merged_df.columns if col not in [
-                    "source_idx", "original_idx"
-                ]
+            # from which DataFrame the results come from. The source index is
+            # inserted once on the merged frame instead of assigning (and
+            # copying) a column per section.
+            frames = [
+                df.reset_index(names="original_idx") for df in results
             ]
-            merged_df = merged_df[cols]
+            lengths = np.fromiter((len(df) for df in frames), dtype=np.int64)
+            merged_df = pd.concat(frames, ignore_index=True, copy=False)
+            merged_df.insert(
+                0, "source_idx", np.repeat(np.arange(len(frames)), lengths),
+            )
 
         elif method == "custom":
             if agg_func is None:
                 raise ValueError(
                     "When using method='custom', `agg_func` must be provided."
                 )
-            merged_df = agg_func(self.results)
+            merged_df = agg_func(results)
 
         else:
             raise ValueError(f"Unknown method '{method}'")
@@ -1275,35 +1458,33 @@ def compute_idr(emgfile):
     if isinstance(emgfile["MUPULSES"], list):
         # Empty dict to fill with dataframes containing the MUPULSES
         # information
-        idr = {x: np.nan**2 for x in range(emgfile["NUMBER_OF_MUS"])}
+        idr = {}
 
+        fsamp = emgfile["FSAMP"]
         for mu in range(emgfile["NUMBER_OF_MUS"]):
-            # Manage the exception of a single MU and add MUPULSES in column 0
-            df = pd.DataFrame(
-                emgfile["MUPULSES"][mu]
-                if emgfile["NUMBER_OF_MUS"] > 1
-                else np.transpose(np.array(emgfile["MUPULSES"]))
-            )
-
-            # Calculate difference in MUPULSES and add it in column 1
-            df[1] = df[0].diff()
-            # Calculate time in seconds and add it in column 2
-            df[2] = df[0] / emgfile["FSAMP"]
-            # Calculate the idr and add it in column 3
-            df[3] = emgfile["FSAMP"] / df[1]
-
-            df = df.rename(
-                columns={
-                    0: "mupulses",
-                    1: "diff_mupulses",
-                    2: "timesec",
-                    3: "idr",
+            # Manage the exception of a single MU
+            if emgfile["NUMBER_OF_MUS"] > 1:
+                pulses = np.asarray(emgfile["MUPULSES"][mu])
+            else:
+                pulses = np.asarray(emgfile["MUPULSES"]).ravel()
+
+            # Calculate the difference in MUPULSES (NaN for the first firing,
+            # as pd.Series.diff) and the idr on the plain arrays, then build
+            # the pd.DataFrame in a single pass.
+            diff_pulses = np.full(len(pulses), np.nan)
+            if len(pulses) > 1:
+                diff_pulses[1:] = np.diff(pulses)
+
+            idr[mu] = pd.DataFrame(
+                {
+                    "mupulses": pulses,
+                    "diff_mupulses": diff_pulses,
+                    "timesec": pulses / fsamp,
+                    "idr": fsamp / diff_pulses,
                 },
+                copy=False,
             )
 
-            # Add the idr to the idr dict
-            idr[mu] = df
-
         return idr
 
     else:
@@ -1379,7 +1560,12 @@ def delete_mus(
         )
 
     # Create the object to store the new emgfile without the specified MUs.
-    del_emgfile = copy.deepcopy(emgfile)
+    # A shallow copy is sufficient because the containers to change are
+    # reassigned (not modified in-place); only the MUPULSES list, which is
+    # edited in-place, needs its own copy. The unchanged containers (e.g.,
+    # RAW_SIGNAL) are shared with the input emgfile, which is not modified.
+    del_emgfile = dict(emgfile)
+    del_emgfile["MUPULSES"] = copy.copy(del_emgfile["MUPULSES"])
     """
     Need to be changed: ==>
     emgfile =   {
@@ -1424,13 +1610,15 @@ def delete_mus(
         del_emgfile["NUMBER_OF_MUS"] = del_emgfile["NUMBER_OF_MUS"] - 1
 
     elif isinstance(munumber, list):
-        # Delete all the content in the del_emgfile["MUPULSES"] and append
-        # only the MUs that we want to retain (exclude deleted MUs).
-        # This is a workaround to directly deleting, for safer implementation.
-        del_emgfile["MUPULSES"] = []
-        for mu in range(emgfile["NUMBER_OF_MUS"]):
-            if mu not in munumber:
-                del_emgfile["MUPULSES"].append(emgfile["MUPULSES"][mu])
+        # Rebuild del_emgfile["MUPULSES"] with only the MUs that we want to
+        # retain (exclude deleted MUs). This is a workaround to directly
+        # deleting, for safer implementation. The set makes the membership
+        # test O(1) with many MUs to delete.
+        to_remove = set(munumber)
+        del_emgfile["MUPULSES"] = [
+            pulses for mu, pulses in enumerate(emgfile["MUPULSES"])
+            if mu not in to_remove
+        ]
 
         # Subrtact the number of deleted MUs to the total number
         del_emgfile["NUMBER_OF_MUS"] = del_emgfile["NUMBER_OF_MUS"] - len(munumber)
@@ -1454,13 +1642,17 @@ def delete_mus(
         if isinstance(munumber, int):
             munumber = [munumber]
 
-        data = del_emgfile["EXTRAS"]
+        # Shallow copy so that renaming the columns cannot alter the input
+        # emgfile when no column is dropped.
+        data = del_emgfile["EXTRAS"].copy(deep=False)
 
-        for mu in munumber:
-            # Get MU ID
-            mu_id = f"MU_{mu}_"
-            # Remove all columns with MU ID
-            data = data[[col for col in data.columns if not col.startswith(mu_id)]]
+        # Remove all columns with the IDs of the deleted MUs in a single
+        # pass instead of rebuilding the pd.DataFrame once per MU.
+        bad_prefixes = tuple(f"MU_{mu}_" for mu in munumber)
+        keep = [
+            col for col in data.columns if not col.startswith(bad_prefixes)
+        ]
+        data = data.loc[:, keep]
 
         # Rescale the numbers in the remaining column names
         col_list = list(data.columns)
@@ -1499,10 +1691,10 @@ def delete_empty_mus(emgfile):
     """
 
     # Find the index of empty MUs
-    ind = []
-    for i, mu in enumerate(range(emgfile["NUMBER_OF_MUS"])):
-        if len(emgfile["MUPULSES"][mu]) == 0:
-            ind.append(i)
+    ind = [
+        mu for mu, pulses in enumerate(emgfile["MUPULSES"])
+        if len(pulses) == 0
+    ]
 
     emgfile = delete_mus(emgfile, munumber=ind, if_single_mu="remove")
 
@@ -1529,8 +1721,10 @@ def sort_mus(emgfile):
         return emgfile
 
     # Create the object to store the sorted emgfile.
-    # Create a deepcopy to avoid changing the original emgfile
-    sorted_emgfile = copy.deepcopy(emgfile)
+    # A shallow copy avoids duplicating the unchanged containers (e.g.,
+    # RAW_SIGNAL); the sorted containers are reassigned below, so the input
+    # emgfile is not modified.
+    sorted_emgfile = dict(emgfile)
     """
     Need to be changed: ==>
     emgfile =   {
@@ -1549,20 +1743,17 @@ def sort_mus(emgfile):
     """
 
     # Identify the sorting_order by the first MUpulse of every MUs
-    df = []
-    for mu in range(emgfile["NUMBER_OF_MUS"]):
-        if len(emgfile["MUPULSES"][mu]) > 0:
-            df.append(emgfile["MUPULSES"][mu][0])
-        else:
-            df.append(np.inf)
-
-    df = pd.DataFrame(df, columns=["firstpulses"])
-    df.sort_values(by="firstpulses", inplace=True)
-    sorting_order = list(df.index)
+    firstpulses = np.fromiter(
+        (p[0] if len(p) > 0 else np.inf for p in emgfile["MUPULSES"]),
+        dtype=np.float64,
+        count=emgfile["NUMBER_OF_MUS"],
+    )
+    sorting_order = np.argsort(firstpulses, kind="stable").tolist()
 
-    # Sort ACCURACY (single column)
-    for origpos, newpos in enumerate(sorting_order):
-        sorted_emgfile["ACCURACY"].loc[origpos] = emgfile["ACCURACY"].loc[newpos]
+    # Sort ACCURACY (single column) with a positional gather
+    sorted_emgfile["ACCURACY"] = (
+        emgfile["ACCURACY"].iloc[sorting_order].reset_index(drop=True)
+    )
 
     # Sort IPTS (multiple columns, sort by columns, then reset columns' name)
     sorted_emgfile["IPTS"] = sorted_emgfile["IPTS"].reindex(columns=sorting_order)
@@ -1580,8 +1771,9 @@ def sort_mus(emgfile):
     # sorted_emgfile["MUPULSES"] = sorted(
     #   sorted_emgfile["MUPULSES"], key=min, reverse=False)
     # )
-    for origpos, newpos in enumerate(sorting_order):
-        sorted_emgfile["MUPULSES"][origpos] = emgfile["MUPULSES"][newpos]
+    sorted_emgfile["MUPULSES"] = [
+        emgfile["MUPULSES"][newpos] for newpos in sorting_order
+    ]
 
     return sorted_emgfile
 
@@ -1647,13 +1839,35 @@ def compute_covsteady(emgfile, start_steady=-1, end_steady=-1):
         )
         start_steady, end_steady = points[0], points[1]
 
-    ref = emgfile["REF_SIGNAL"].loc[start_steady:end_steady]
-    covsteady = (ref.std() / ref.mean()) * 100
+    # Work on the underlying array; as with .loc, end_steady is included.
+    # ceil/floor reproduce the label-based selection also when the bounds
+    # are passed as floats (e.g., computed from FSAMP). ddof=1 matches the
+    # pandas std.
+    start_ = int(np.ceil(start_steady))
+    end_ = int(np.floor(end_steady))
+    ref = emgfile["REF_SIGNAL"].to_numpy()[start_:end_ + 1, 0]
+    covsteady = (ref.std(ddof=1) / ref.mean()) * 100
+
+    return float(covsteady)
+
 
-    return covsteady[0]
+@lru_cache(maxsize=32)
+def _butter_sos(order, wn, btype, fs):
+    """
+    Design a Butterworth filter in second-order sections.
+
+    Thin cached wrapper around scipy.signal.butter so that repeated calls
+    with the same design (e.g., filtering many files at the same sampling
+    frequency) reuse the SOS matrix. Wn must be hashable, so pass a tuple
+    instead of a list for band-pass filters.
+    """
 
+    return signal.butter(N=order, Wn=wn, btype=btype, output="sos", fs=fs)
 
-def filter_rawemg(emgfile, order=2, lowcut=20, highcut=500):
+
+def filter_rawemg(
+    emgfile, order=2, lowcut=20, highcut=500, n_jobs=1, dtype="float32",
+):
     """
     Band-pass filter the RAW_SIGNAL.
 
@@ -1669,6 +1883,17 @@ def filter_rawemg(emgfile, order=2, lowcut=20, highcut=500):
         The lower cut-off frequency in Hz.
     highcut : int, default 500
         The higher cut-off frequency in Hz.
+    n_jobs : int, default 1
+        The number of parallel jobs used to filter the channels. If 1
+        (default), all the channels are filtered in a single batched call.
+        If greater than 1, the channels are split in n_jobs blocks filtered
+        in parallel threads, which can speed up large arrays. If -1, all
+        the available cores are used. The result does not depend on n_jobs.
+    dtype : str {"float32", "float64"}, default "float32"
+        The dtype used to run the filter. EMG recordings are inherently
+        16-bit quantized, so filtering in single precision loses no
+        meaningful information while halving memory traffic. Pass
+        "float64" to filter in double precision.
 
     Returns
     -------
@@ -1684,28 +1909,43 @@ def filter_rawemg(emgfile, order=2, lowcut=20, highcut=500):
     - filter_refsig : low-pass filter the REF_SIGNAL.
     """
 
-    filteredrawsig = copy.deepcopy(emgfile)
+    # A shallow copy is sufficient: only RAW_SIGNAL changes and it is
+    # reassigned below, so the input emgfile is not modified.
+    filteredrawsig = dict(emgfile)
 
     # Calculate the components of the filter and apply them with filtfilt to
     # obtain Zero-lag filtering. sos should be preferred over filtfilt as
     # second-order sections have fewer numerical problems.
-    sos = signal.butter(
-        N=order,
-        Wn=[lowcut, highcut],
-        btype="bandpass",
-        output="sos",
-        fs=filteredrawsig["FSAMP"],
+    sos = _butter_sos(
+        order, (lowcut, highcut), "bandpass", filteredrawsig["FSAMP"],
     )
-    for col in filteredrawsig["RAW_SIGNAL"]:
-        filteredrawsig["RAW_SIGNAL"][col] = signal.sosfiltfilt(
-            sos,
-            x=filteredrawsig["RAW_SIGNAL"][col],
+    # Filter all the channels with batched calls along axis 0 instead of
+    # re-entering sosfiltfilt once per column. The result is a fresh
+    # ndarray, so the input signal is not modified. sosfiltfilt releases
+    # the GIL, so with n_jobs != 1 independent channel blocks can be
+    # filtered in parallel threads.
+    raw = emgfile["RAW_SIGNAL"].to_numpy().astype(np.dtype(dtype), copy=False)
+    # Cast the sos to the working dtype as well, sosfiltfilt would
+    # otherwise upcast the computation to the widest of the two.
+    sos = sos.astype(raw.dtype, copy=False)
+    if n_jobs == 1:
+        filtered = signal.sosfiltfilt(sos, raw, axis=0)
+    else:
+        n_blocks = min(effective_n_jobs(n_jobs), raw.shape[1])
+        parts = Parallel(n_jobs=n_blocks, prefer="threads")(
+            delayed(signal.sosfiltfilt)(sos, block, axis=0)
+            for block in np.array_split(raw, n_blocks, axis=1)
         )
+        filtered = np.concatenate(parts, axis=1)
+    filteredrawsig["RAW_SIGNAL"] = pd.DataFrame(
+        filtered,
+        columns=emgfile["RAW_SIGNAL"].columns,
+    )
 
     return filteredrawsig
 
 
-def filter_refsig(emgfile, order=4, cutoff=15):
+def filter_refsig(emgfile, order=4, cutoff=15, dtype="float32"):
     """
     Low-pass filter the REF_SIGNAL.
 
@@ -1720,6 +1960,9 @@ def filter_refsig(emgfile, order=4, cutoff=15):
         The filter order.
     cutoff : int, default 15
         The cut-off frequency in Hz.
+    dtype : str {"float32", "float64"}, default "float32"
+        The dtype used to run the filter. Pass "float64" to filter in
+        double precision.
 
     Returns
     -------
@@ -1732,21 +1975,22 @@ def filter_refsig(emgfile, order=4, cutoff=15):
     - filter_rawemg : band-pass filter the RAW_SIGNAL.
     """
 
-    filteredrefsig = copy.deepcopy(emgfile)
+    # A shallow copy is sufficient: only REF_SIGNAL changes and it gets its
+    # own copy below, so the input emgfile is not modified. The other
+    # containers are shared with the input.
+    filteredrefsig = dict(emgfile)
+    filteredrefsig["REF_SIGNAL"] = emgfile["REF_SIGNAL"].copy()
 
     # Calculate the components of the filter and apply them with filtfilt to
     # obtain Zero-lag filtering. sos should be preferred over filtfilt as
     # second-order sections have fewer numerical problems.
-    sos = signal.butter(
-        N=order,
-        Wn=cutoff,
-        btype="lowpass",
-        output="sos",
-        fs=filteredrefsig["FSAMP"],
+    sos = _butter_sos(order, cutoff, "lowpass", filteredrefsig["FSAMP"])
+    ref = filteredrefsig["REF_SIGNAL"][0].to_numpy().astype(
+        np.dtype(dtype), copy=False,
     )
     filteredrefsig["REF_SIGNAL"][0] = signal.sosfiltfilt(
-        sos,
-        x=filteredrefsig["REF_SIGNAL"][0],
+        sos.astype(ref.dtype, copy=False),
+        x=ref,
     )
 
     return filteredrefsig
@@ -1791,14 +2035,23 @@ def remove_offset(emgfile, offsetval=0, auto=0):
         )
 
     # Create the object to store the filtered refsig.
-    # Create a deepcopy to avoid changing the original refsig
-    offs_emgfile = copy.deepcopy(emgfile)
+    # A shallow copy avoids changing the original refsig without duplicating
+    # the unchanged containers. The subtraction works in-place on a copy of
+    # the underlying array, skipping pandas alignment and Series boxing.
+    offs_emgfile = dict(emgfile)
+    ref = emgfile["REF_SIGNAL"].to_numpy()
+    if np.issubdtype(ref.dtype, np.floating):
+        ref = ref.copy()
+    else:
+        # Integer reference signals must upcast to float, the offset is
+        # fractional and the in-place subtraction would not cast.
+        ref = ref.astype(np.float64)
 
     # Act differently if automatic removal of the offset is active (>0) or not
     if auto <= 0:
         if offsetval != 0:
             # Directly subtract the offset value.
-            offs_emgfile["REF_SIGNAL"][0] = offs_emgfile["REF_SIGNAL"][0] - offsetval
+            ref[:, 0] -= offsetval
 
         else:
             # Select the area to calculate the offset
@@ -1810,25 +2063,22 @@ def remove_offset(emgfile, offsetval=0, auto=0):
                 "key. When ready, press enter."
             )
             points = showselect(
-                emgfile=offs_emgfile,
+                emgfile=emgfile,
                 title=title,
                 titlesize=10,
             )
             start_, end_ = points[0], points[1]
 
-            offsetval = offs_emgfile["REF_SIGNAL"].loc[start_:end_].mean()
-            # We need to convert the series offsetval into float
-            offs_emgfile["REF_SIGNAL"][0] = (
-                offs_emgfile["REF_SIGNAL"][0] - float(offsetval[0])
-            )
+            # As with .loc, end_ is included
+            ref[:, 0] -= ref[start_:end_ + 1, 0].mean()
 
     else:
         # Compute and subtract the offset value.
-        offsetval = offs_emgfile["REF_SIGNAL"].iloc[0:auto].mean()
-        # We need to convert the series offsetval into float
-        offs_emgfile["REF_SIGNAL"][0] = (
-            offs_emgfile["REF_SIGNAL"][0] - float(offsetval[0])
-        )
+        ref[:, 0] -= ref[:auto, 0].mean()
+
+    offs_emgfile["REF_SIGNAL"] = pd.DataFrame(
+        ref, columns=emgfile["REF_SIGNAL"].columns,
+    )
 
     return offs_emgfile
 
@@ -1888,8 +2138,10 @@ def get_mvc(emgfile, how="showselect", conversion_val=0):
     50.86
     """
 
+    ref = emgfile["REF_SIGNAL"].to_numpy()
+
     if how == "all":
-        mvc = emgfile["REF_SIGNAL"].max()
+        mvc = float(ref[:, 0].max())
 
     elif how == "showselect":
         # Select the area to measure the MVC (maximum value)
@@ -1905,15 +2157,13 @@ def get_mvc(emgfile, how="showselect", conversion_val=0):
         )
         start_, end_ = points[0], points[1]
 
-        mvc = emgfile["REF_SIGNAL"].loc[start_:end_].max()
+        mvc = float(ref[start_:end_ + 1, 0].max())
 
     else:
         raise ValueError(
             f"how must be one of 'showselect' or 'all', {how} was passed instead"
         )
 
-    mvc = float(mvc[0])
-
     if conversion_val != 0:
         mvc = mvc * conversion_val
 
@@ -2018,21 +2268,26 @@ def compute_rfd(
         )
         start_ = points[0]
 
-    # Create a dict to add the RFD
-    rfd_dict = dict.fromkeys(ms, None)
-    # Loop through the ms list and calculate the respective rfd.
-    for thisms in ms:
-        ms_insamples = round((int(thisms) * emgfile["FSAMP"]) / 1000)
+    # Convert the REF_SIGNAL once and compute the RFD for all the ms
+    # ranges in a single gather.
+    ref = emgfile["REF_SIGNAL"].to_numpy()[:, 0]
+    ms_arr = np.asarray(ms)
+    ms_insamples = np.round(
+        (ms_arr.astype(int) * emgfile["FSAMP"]) / 1000
+    ).astype(int)
 
-        n_0 = emgfile["REF_SIGNAL"].loc[start_]
-        n_next = emgfile["REF_SIGNAL"].loc[start_ + ms_insamples]
+    n_0 = ref[start_]
+    n_next = ref[start_ + ms_insamples]
 
-        rfdval = (n_next - n_0) / (thisms / 1000)
-        # (ms/1000 to convert mSec in Sec)
+    # (ms/1000 to convert mSec in Sec)
+    divisors = ms_arr / 1000
+    if np.issubdtype(ref.dtype, np.floating):
+        # Keep the original (e.g., float32) precision of the REF_SIGNAL.
+        # Integer signals divide by the float64 divisors and upcast.
+        divisors = divisors.astype(ref.dtype)
+    rfd_vals = (n_next - n_0) / divisors
 
-        rfd_dict[thisms] = rfdval
-
-    rfd = pd.DataFrame(rfd_dict)
+    rfd = pd.DataFrame([rfd_vals], columns=ms)
 
     if conversion_val != 0:
         rfd = rfd * conversion_val
@@ -2040,6 +2295,19 @@ def compute_rfd(
     return rfd
 
 
+def _locate_breakpoints(bkpnt, predind, side="left"):
+    """
+    Locate breakpoints in the prediction sample vector.
+
+    Return the index (or array of indices) of the interval of predind
+    containing each value in bkpnt. With side="left" the interval is
+    (predind[i], predind[i+1]], with side="right" it is
+    [predind[i], predind[i+1]). predind must be sorted.
+    """
+
+    return np.searchsorted(predind, bkpnt, side=side) - 1
+
+
 def compute_svr(
     emgfile,
     gammain=1/1.6,
@@ -2117,26 +2385,39 @@ def compute_svr(
     # TODO input checking and edge cases
     idr = compute_idr(emgfile)  # Calc IDR
 
+    # Convert the IDR frames to plain arrays once, the loop below then
+    # works with integer indexing and array slicing only.
+    idr_np = [
+        (
+            idr[mu]["timesec"].to_numpy(),
+            idr[mu]["idr"].to_numpy(),
+            idr[mu]["diff_mupulses"].to_numpy(),
+            idr[mu]["mupulses"].to_numpy(),
+        )
+        for mu in range(len(idr))
+    ]
+
     svrfit_acm = []
     svrtime_acm = []
     gensvr_acm = []
     for mu in range(len(idr)):  # For all MUs
+        tsec, dr, dmu, mup_all = idr_np[mu]
         # Skip if no data
-        if idr[mu].size==0:
+        if tsec.size == 0:
             svrfit_acm.append([])
             svrtime_acm.append([])
             gensvr_acm.append(np.nan*np.ones(emgfile["EMG_LENGTH"]))
 
         else:            # Train the model on the data.
             # Time vector, removing first element.
-            xtmp = np.transpose([idr[mu].timesec[1:]])
+            xtmp = tsec[1:, None]
             # Discharge rates, removing first element, since DR has been assigned
             # to second pulse.
-            ytmp = idr[mu].idr[1:].to_numpy()
+            ytmp = dr[1:]
             # Time between discharges, will use for discontinuity calc
-            xdiff = idr[mu].diff_mupulses[2:].values
+            xdiff = dmu[2:]
             # Motor unit pulses, samples
-            mup = np.array(idr[mu].mupulses[1:].values)
+            mup = mup_all[1:]
 
             # Defining weight vector. A scaling applied to the regularization
             # parameter, per sample.
@@ -2177,64 +2458,68 @@ def compute_svr(
 
             # Make predictions on the data
             if len(bkpnt) > 0:  # If there is a point of discontinuity
+                # Fit and time segments are accumulated and concatenated
+                # once, instead of growing the arrays with np.append at
+                # every discontinuity.
+                fit_segments = []
+                tm_segments = []
+
                 if bkpnt[0] == mup[0]:  # When first firing is discontinuity
-                    smoothfit = np.nan*np.ones(1)
-                    newtm = np.nan*np.ones(1)
+                    tm_segments.append(np.nan*np.ones(1))
                     bkpnt = bkpnt[1:]
 
-                tmptm = predtime[
-                    0: np.where(
-                        (bkpnt[0] >= predind[0:-1]) & (bkpnt[0] < predind[1:])
-                    )[0][0],
-                ]  # Break up time vector for first continous range of firing
-                smoothfit = svr.predict(tmptm)  # Predict with svr model
-                newtm = np.append(newtm,tmptm,)  # Track new time vector
-
-                tmpind = predind[
-                    0: np.where(
-                        (bkpnt[0] >= predind[0:-1]) & (bkpnt[0] < predind[1:])
-                    )[0][0]
-                ]  # Sample vector of first continous range of firing
-                
+                # Predict over the whole range in one call, the continuous
+                # regions of firing are then sliced out of the result.
+                full_pred = svr.predict(predtime)
+
+                # End of the first continous range of firing
+                first_stop = int(
+                    _locate_breakpoints(bkpnt[0], predind, side="right")
+                )
+                # Break up time vector for first continous range of firing
+                tmptm = predtime[0:first_stop]
+                fit_segments.append(full_pred[0:first_stop])
+                tm_segments.append(tmptm.ravel())  # Track new time vector
+
+                # Sample vector of first continous range of firing
+                tmpind = predind[0:first_stop]
+
                 # Fill corresponding sample indices with svr fit
-                gen_svr[tmpind.astype(np.int64)] = smoothfit
+                gen_svr[tmpind.astype(np.int64)] = fit_segments[-1]
                 # Add last firing as discontinuity
                 bkpnt = np.append(bkpnt, mup[-1])
+                # Indices of all discontinuities, located in one pass
+                bkpnt_idxs = _locate_breakpoints(bkpnt, predind)
                 for ii in range(len(bkpnt)-1):  # All instances of discontinuity
-                    curind = np.where(
-                        (bkpnt[ii] > predind[0:-1]) & (bkpnt[ii] <= predind[1:])
-                    )[0][0]  # Current index of discontinuity
-                    nextind = np.where(
-                        (bkpnt[ii+1] > predind[0:-1]) & (bkpnt[ii+1] <= predind[1:])
-                    )[0][0]  # Next index of discontinuity
+                    # Current index of discontinuity
+                    curind = int(bkpnt_idxs[ii])
+                    # Next index of discontinuity
+                    nextind = int(bkpnt_idxs[ii+1])
 
                     # MU firing before discontinuity
-                    curmup = np.where(mup == bkpnt[ii])[0][0]
-                    curind_nmup = np.where(
-                        (mup[curmup+1] > predind[0:-1]) & (mup[curmup+1] <= predind[1:])
-                    )[0][0]  # MU firing after discontinuity
+                    curmup = int(np.searchsorted(mup, bkpnt[ii]))
+                    curind_nmup = int(
+                        _locate_breakpoints(mup[curmup+1], predind)
+                    )  # MU firing after discontinuity
 
                     # If the next discontinuity is the next MU firing, nan fill
                     if curind_nmup >= nextind:
                         # Edge case NEED TO CHECK THE GREATER THAN CASE>> WHY TODO
-                        smoothfit = np.append(smoothfit, np.nan*np.ones(1))
-                        newtm = np.append(newtm, np.nan*np.ones(1))
+                        fit_segments.append(np.nan*np.ones(1))
+                        tm_segments.append(np.nan*np.ones(1))
                     else:  # Fit next continuous region of firing
-                        smoothfit = np.append(
-                            smoothfit,
-                            np.nan*np.ones(len(predtime[curind:curind_nmup])-2),
-                        )
-                        smoothfit = np.append(
-                            smoothfit, svr.predict(predtime[curind_nmup:nextind]),
-                        )
-                        newtm = np.append(
-                            newtm,
-                            np.nan*np.ones(len(predtime[curind:curind_nmup])-2),
-                        )
-                        newtm = np.append(newtm, predtime[curind_nmup:nextind],)
-                        gen_svr[predind[curind_nmup:nextind]] = svr.predict(
-                            predtime[curind_nmup:nextind]
+                        gap = np.nan*np.ones(curind_nmup - curind - 2)
+                        segfit = full_pred[curind_nmup:nextind]
+                        fit_segments.append(gap)
+                        fit_segments.append(segfit)
+                        tm_segments.append(gap)
+                        tm_segments.append(
+                            predtime[curind_nmup:nextind].ravel()
                         )
+                        gen_svr[predind[curind_nmup:nextind]] = segfit
+
+                smoothfit = np.concatenate(fit_segments)
+                newtm = np.concatenate(tm_segments)
             else:
                 smoothfit = svr.predict(predtime)
                 newtm = predtime